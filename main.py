@@ -3,15 +3,19 @@
 import argparse
 import asyncio
 import atexit
-import json
+import os
 import signal
 import socket
 import sys
+import threading
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
+from queue import Empty as QueueEmpty
+from typing import TYPE_CHECKING, Any
 
-import uvicorn
-
-from src import __version__
+import src
+from src.core import jsonio
 from src.core.config import ConfigManager
 from src.core.logger import get_logger, setup_logging
 from src.mcp.client import MCPClientManager
@@ -19,7 +23,9 @@ from src.mcp.router import MCPRouter
 from src.mcp.server import MCPServer
 from src.utils.security import SecurityManager
 from src.utils.validator import InputValidator
-from src.utils.watcher import FileWatcher
+
+if TYPE_CHECKING:
+    from src.utils.watcher import FileWatcher
 
 logger = get_logger(__name__)
 
@@ -50,17 +56,14 @@ def signal_handler(signum, frame):
         sys.exit(1)
     else:
         # 第一次 Ctrl+C - 优雅关闭
-        logger.info(f"接收到信号 {signum}，正在优雅关闭... (再次按 Ctrl+C 强制退出)")
+        logger.info("接收到信号 %s，正在优雅关闭... (再次按 Ctrl+C 强制退出)", signum)
         _shutdown_requested = True
         raise KeyboardInterrupt
 
 
-# 注册清理函数
-atexit.register(cleanup)
-
-# 注册信号处理（支持两次 Ctrl+C）
-signal.signal(signal.SIGINT, signal_handler)
-signal.signal(signal.SIGTERM, signal_handler)
+# add 命令输出的标准字段顺序，其余字段（metadata 等）保持原顺序追加在后
+_SETTINGS_FIELD_ORDER = ("name", "type", "command", "args", "env", "isActive", "provider")
+_SETTINGS_FIELDS = frozenset(_SETTINGS_FIELD_ORDER)
 
 
 def _extract_name_from_config(data: dict) -> str | None:
@@ -83,479 +86,628 @@ def _extract_name_from_config(data: dict) -> str | None:
     return None
 
 
-def find_available_port(host: str, start_port: int, max_attempts: int = 100) -> int:
-    """查找可用端口，从start_port开始递增。
+def _load_name_cache(cache_path: Path) -> dict[str, list]:
+    """读取 add 命令使用的名称缓存。
+
+    Args:
+        cache_path: 缓存文件路径
+
+    Returns:
+        {配置文件路径: [mtime_ns, size, name]}，读取失败时返回空字典
+    """
+    try:
+        cache = jsonio.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_name_cache(cache_path: Path, cache: dict[str, list]) -> None:
+    """写回 add 命令使用的名称缓存（失败时忽略，仅影响下次扫描速度）。
+
+    Args:
+        cache_path: 缓存文件路径
+        cache: {配置文件路径: [mtime_ns, size, name]}
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        jsonio.dump_file(cache_path, cache)
+    except OSError as e:
+        logger.debug("无法写入名称缓存 %s: %s", cache_path, e)
+
+
+def _cached_config_name(cfg_file: str, old_cache: dict, new_cache: dict) -> str | None:
+    """读取配置文件中的 name 字段，文件 (mtime, size) 未变化时直接使用缓存。
+
+    Args:
+        cfg_file: mcp_settings.json 路径
+        old_cache: 上次保存的缓存
+        new_cache: 本次扫描生成的缓存（仅保留仍存在的文件）
+
+    Returns:
+        配置中的 name 字段值，文件为空或损坏时返回 None
+
+    Raises:
+        OSError: 文件不存在或无法访问
+    """
+    st = os.stat(cfg_file)
+    cached = old_cache.get(cfg_file)
+    if (
+        isinstance(cached, list)
+        and len(cached) == 3
+        and cached[0] == st.st_mtime_ns
+        and cached[1] == st.st_size
+    ):
+        new_cache[cfg_file] = cached
+        return cached[2]
+
+    name = None
+    try:
+        with open(cfg_file, "rb") as f:
+            content = f.read().strip()
+        if content:
+            name = _extract_name_from_config(jsonio.loads(content))
+    except (OSError, ValueError):
+        # 跳过损坏/非法配置文件
+        pass
+
+    new_cache[cfg_file] = [st.st_mtime_ns, st.st_size, name]
+    return name
+
+
+def bind_api_socket(host: str, start_port: int, auto_find_port: bool = True) -> socket.socket:
+    """创建 API 服务器的监听套接字，端口被占用时可由系统分配空闲端口。
+
+    已监听的套接字直接交给 uvicorn，避免“检测端口 → 关闭 → 重新绑定”之间端口被其他进程占用。
+    socket.create_server 在 POSIX 上会设置 SO_REUSEADDR，重启时不受 TIME_WAIT 影响；
+    不使用 SO_REUSEPORT，否则无法发现端口已被其他进程占用。
 
     Args:
-        host: 主机地址
-        start_port: 起始端口
-        max_attempts: 最大尝试次数
+        host: 主机地址（IPv6 地址监听 "::" 时在支持的系统上同时接受 IPv4）
+        start_port: 首选端口
+        auto_find_port: 首选端口被占用时是否改用系统分配的端口
 
     Returns:
-        可用的端口号
+        已绑定并开始监听的套接字
 
     Raises:
+        OSError: 首选端口不可用且未启用自动查找
         RuntimeError: 如果找不到可用端口
     """
-    for port in range(start_port, start_port + max_attempts):
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind((host, port))
-                return port
-        except OSError:
-            continue
-    raise RuntimeError(f"无法找到可用端口 (尝试范围: {start_port}-{start_port + max_attempts - 1})")
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    dualstack = host == "::" and socket.has_dualstack_ipv6()
 
+    try:
+        return socket.create_server(
+            (host, start_port), family=family, dualstack_ipv6=dualstack
+        )
+    except OSError:
+        if not auto_find_port:
+            raise
 
-async def poll_watcher_queue(queue, client_manager):
-    """Poll watcher queue for file changes without blocking main process.
+    try:
+        return socket.create_server((host, 0), family=family, dualstack_ipv6=dualstack)
+    except OSError as e:
+        raise RuntimeError(f"无法找到可用端口 (首选端口: {start_port}): {e}") from e
+
+
+def _run_event_loop(main_coro) -> None:
+    """运行主协程；非 Windows 平台安装了 uvloop 时使用 uvloop 事件循环。
 
     Args:
-        queue: Multiprocessing queue from watcher subprocess
-        client_manager: MCP client manager instance
+        main_coro: 主协程
     """
-    while True:
+    if sys.platform != "win32":
         try:
-            # Non-blocking check for events
-            if not queue.empty():
-                event = queue.get_nowait()
-                file_path = event["path"]
-                event_type = event["event_type"]
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            uvloop.run(main_coro)
+            return
 
-                logger.info(f"Config file {event_type}: {file_path}")
+    asyncio.run(main_coro)
 
-                path = Path(file_path)
-                provider = path.parent.name
 
-                # Log only, don't reload to avoid disrupting connections
-                if event_type == "deleted":
-                    logger.info(
-                        f"Config deleted for provider '{provider}' (reload on next restart)"
-                    )
-                else:
-                    logger.info(
-                        f"Config updated for provider '{provider}' (reload on next restart)"
-                    )
+def _enable_eager_tasks() -> None:
+    """在 Python 3.12+ 上为当前事件循环启用 eager task factory。
 
-            # Sleep to avoid busy-waiting
-            await asyncio.sleep(0.5)
-        except Exception as e:
-            logger.error(f"Error polling watcher queue: {e}")
-            await asyncio.sleep(1)
+    新任务会立即同步执行到第一次挂起，省去一次调度往返；旧版本 Python 保持默认行为。
+    """
+    factory = getattr(asyncio, "eager_task_factory", None)
+    if factory is not None:
+        asyncio.get_running_loop().set_task_factory(factory)
 
 
-async def run_mcp_server(config: ConfigManager):
-    """Run MCP server mode with specified transport.
+def _install_signal_handlers(stop_event: asyncio.Event) -> None:
+    """通过事件循环处理 SIGINT/SIGTERM - 第一次设置停止事件优雅关闭，第二次强制退出。
+
+    信号在事件循环中处理，不会在任意字节码位置抛出 KeyboardInterrupt；
+    清理过程中再收到信号也不会打断 watcher/客户端的关闭流程。
+    事件循环不支持 add_signal_handler 时（Windows）保留 signal_handler 的处理方式。
 
     Args:
-        config: Configuration manager
+        stop_event: 收到信号时设置的停止事件
     """
-    global _watcher, _client_manager
+    loop = asyncio.get_running_loop()
 
-    transport_type = config.get("server.transport_type", "stdio")
-    logger.info(f"Starting MCP Router in SERVER mode ({transport_type})...")
+    def _graceful(signum: int) -> None:
+        global _shutdown_requested
 
-    timeout = config.get("mcp_client.timeout", 30.0)
-    data_path = config.get("watcher.watch_path", "data")
+        if _shutdown_requested:
+            # 第二次信号 - 强制退出，不再等待事件循环收尾
+            logger.warning("强制退出...")
+            cleanup()
+            os._exit(1)
 
-    # 初始化管理器
-    client_manager = MCPClientManager(data_path=data_path, timeout=timeout)
-    _client_manager = client_manager
-    router = MCPRouter(client_manager)
+        logger.info("接收到信号 %s，正在优雅关闭... (再次按 Ctrl+C 强制退出)", signum)
+        _shutdown_requested = True
+        stop_event.set()
 
-    watcher = None
-    watcher_queue = None
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, _graceful, sig)
+        except (NotImplementedError, RuntimeError):
+            return
 
-    if config.get("watcher.enabled", True):
-        watcher = FileWatcher(
-            watch_path=data_path,
-            debounce_delay=config.get("watcher.debounce_delay", 1.0),
-        )
-        _watcher = watcher
-        watcher_queue = watcher.start()
 
-    # 初始化并启动 MCP 服务器（立即启动，不等待客户端加载）
-    allow_management = config.get("server.allow_instance_management", False)
-    server = MCPServer(
-        router,
-        name="mcp_router",
-        allow_instance_management=allow_management,
-        transport_type=transport_type,
-    )
-    logger.info(
-        f"MCP Server ready - starting service... (management: {allow_management}, transport: {transport_type})"
-    )
+def _drain_watcher_queue(
+    queue, loop: asyncio.AbstractEventLoop, reader_fd: int, events: asyncio.Queue
+) -> None:
+    """队列管道可读时由事件循环回调，非阻塞地取出所有已到达的事件。
 
-    async def load_clients_in_background():
-        """在后台加载客户端配置"""
-        try:
-            await client_manager.load_configurations()
-            logger.info("All MCP client instances loaded in background")
-        except Exception as e:
-            logger.error(f"Error loading MCP clients: {e}", exc_info=True)
-
-    # 并发运行：服务器 + 后台加载客户端 + 配置监视
-    host = config.get("server.host", "127.0.0.1")
+    Args:
+        queue: Multiprocessing queue from watcher subprocess
+        loop: Event loop the reader callback is registered on
+        reader_fd: File descriptor of the queue's reading end
+        events: Asyncio queue consumed by :func:`poll_watcher_queue`
+    """
+    try:
+        while queue._reader.poll():
+            event = queue.get_nowait()
+            # None 是 FileWatcher.stop() 发送的结束标记，原样转交以结束 poll_watcher_queue
+            if event is None:
+                loop.remove_reader(reader_fd)
+                events.put_nowait(None)
+                return
+            events.put_nowait(event)
+    except QueueEmpty:
+        # 另一端的数据尚未完整写入，等待下一次可读通知
+        pass
+    except (EOFError, OSError) as e:
+        # watcher 子进程异常退出，队列管道关闭
+        logger.warning("Watcher queue closed: %s", e)
+        loop.remove_reader(reader_fd)
+        events.put_nowait(None)
 
-    if transport_type == "stdio":
-        tasks = [server.run(), load_clients_in_background()]
-    else:
-        # SSE/HTTP需要host和port - 根据传输模式获取对应端口
-        port_key = f"server.{transport_type}.port"
-        default_ports = {"http": 3000, "sse": 3001}
-        port = config.get(port_key, default_ports.get(transport_type, 3000))
-        logger.info(f"MCP Server will listen on {host}:{port} ({transport_type} mode)")
-        tasks = [server.run(host, port), load_clients_in_background()]
 
-    if watcher_queue:
-        tasks.append(poll_watcher_queue(watcher_queue, client_manager))
+def _forward_watcher_events(queue, loop: asyncio.AbstractEventLoop, events: asyncio.Queue) -> None:
+    """在后台线程中阻塞读取 watcher 队列，并将事件转发到事件循环。
 
-    try:
-        await asyncio.gather(*tasks)
-    except (KeyboardInterrupt, SystemExit):
-        logger.info("Shutting down MCP server...")
-    finally:
-        # 清理资源，使用超时保护确保不会卡住
-        cleanup_tasks = []
+    Args:
+        queue: Multiprocessing queue from watcher subprocess
+        loop: Event loop that owns ``events``
+        events: Asyncio queue consumed by :func:`poll_watcher_queue`
+    """
+    while True:
+        try:
+            event = queue.get()
+        except (EOFError, OSError, TypeError):
+            # 队列管道已关闭（进程退出时关闭正在读取的管道会抛出 TypeError）
+            event = None
 
-        if watcher:
-            try:
-                watcher.stop()
-            except Exception as e:
-                logger.error(f"Error stopping watcher: {e}")
+        try:
+            loop.call_soon_threadsafe(events.put_nowait, event)
+        except RuntimeError:
+            # 事件循环已关闭
+            break
 
-        if client_manager:
-            cleanup_tasks.append(client_manager.shutdown())
+        # None 是 FileWatcher.stop() 发送的结束标记
+        if event is None:
+            break
 
-        # 等待清理完成，最多等待10秒
-        if cleanup_tasks:
-            try:
-                await asyncio.wait_for(
-                    asyncio.gather(*cleanup_tasks, return_exceptions=True), timeout=10.0
-                )
-            except asyncio.TimeoutError:
-                logger.warning("Cleanup timeout, forcing exit")
-            except Exception as e:
-                logger.error(f"Error during cleanup: {e}")
 
+async def poll_watcher_queue(queue, client_manager):
+    """Wait for file change events from the watcher without blocking main process.
 
-async def run_api_server(config: ConfigManager):
-    """Run API server mode.
+    The event loop watches the queue's pipe directly (a daemon reader thread is
+    used where ``add_reader`` is unsupported), so this coroutine is only
+    scheduled when an event arrives.
 
     Args:
-        config: Configuration manager
+        queue: Multiprocessing queue from watcher subprocess
+        client_manager: MCP client manager instance
     """
-    global _watcher, _client_manager
+    loop = asyncio.get_running_loop()
+    events: asyncio.Queue = asyncio.Queue()
 
-    from src.api.app import create_app
+    # watcher 上报的路径形如 <watch_path>/<provider>/mcp_settings.json，前缀在启动时即可确定
+    watch_prefix = f"{client_manager.data_path}{os.sep}"
 
-    logger.info("Starting MCP Router in API mode...")
+    # 优先由事件循环直接监听队列管道；不支持 add_reader 的事件循环（Windows Proactor）改用读取线程
+    try:
+        reader_fd = queue._reader.fileno()
+        loop.add_reader(reader_fd, _drain_watcher_queue, queue, loop, reader_fd, events)
+    except (AttributeError, NotImplementedError, OSError):
+        reader_fd = None
+        threading.Thread(
+            target=_forward_watcher_events,
+            args=(queue, loop, events),
+            name="watcher-queue-reader",
+            daemon=True,
+        ).start()
 
-    timeout = config.get("mcp_client.timeout", 30.0)
-    data_path = config.get("watcher.watch_path", "data")
+    try:
+        while True:
+            # 一次唤醒处理完已到达的所有事件，同一文件只保留最后一次变更
+            changes: dict[str, str] = {}
+            stopped = False
+            event = await events.get()
+            while True:
+                # None 表示 watcher 已停止或队列已关闭
+                if event is None:
+                    stopped = True
+                    break
+                file_path, event_type = event
+                changes[file_path] = event_type
+                try:
+                    event = events.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
 
-    # 初始化管理器
-    client_manager = MCPClientManager(data_path=data_path, timeout=timeout)
-    _client_manager = client_manager
-    router = MCPRouter(client_manager)
+            for file_path, event_type in changes.items():
+                _handle_watcher_event(file_path, event_type, watch_prefix)
+            if stopped:
+                return
+    finally:
+        if reader_fd is not None and not loop.is_closed():
+            loop.remove_reader(reader_fd)
 
-    security_manager = SecurityManager(
-        bearer_token=config.get("security.bearer_token"),
-        enable_validation=config.get("security.enable_validation", True),
-    )
 
-    watcher = None
-    watcher_queue = None
+def _handle_watcher_event(file_path: str, event_type: str, watch_prefix: str) -> None:
+    """处理单个配置文件变更事件。
 
-    if config.get("watcher.enabled", True):
-        watcher = FileWatcher(
-            watch_path=data_path,
-            debounce_delay=config.get("watcher.debounce_delay", 1.0),
-        )
-        _watcher = watcher
-        watcher_queue = watcher.start()
+    Args:
+        file_path: 变更的配置文件路径
+        event_type: 变更类型（created/modified/deleted）
+        watch_prefix: 监视目录路径（以路径分隔符结尾）
+    """
+    logger.info("Config file %s: %s", event_type, file_path)
 
-    # 创建 API 应用（立即启动，不等待客户端加载）
-    enable_realtime_logs = config.get("api.enable_realtime_logs", False)
+    # 去掉监视目录前缀后第一段即为 provider；路径被解析为绝对路径时（如 macOS FSEvents）退回按末尾切分
+    if file_path.startswith(watch_prefix):
+        provider = file_path[len(watch_prefix) :].split(os.sep, 1)[0]
+    else:
+        parts = file_path.rsplit(os.sep, 2)
+        provider = parts[-2] if len(parts) > 1 else ""
 
-    # 如果启用WebSocket实时日志，添加日志处理器
-    if enable_realtime_logs:
-        from src.utils.websocket_logger import enable_websocket_logging
+    # Log only, don't reload to avoid disrupting connections
+    if event_type == "deleted":
+        logger.info("Config deleted for provider '%s' (reload on next restart)", provider)
+    else:
+        logger.info("Config updated for provider '%s' (reload on next restart)", provider)
 
-        enable_websocket_logging(
-            level=config.get("logging.level", "INFO"),
+
+async def _load_clients(client_manager: MCPClientManager) -> None:
+    """在后台加载客户端配置
+
+    Args:
+        client_manager: MCP client manager instance
+    """
+    try:
+        await client_manager.load_configurations()
+        logger.info("All MCP client instances loaded in background")
+    except Exception as e:
+        logger.error("Error loading MCP clients: %s", e, exc_info=True)
+
+
+@dataclass(frozen=True, slots=True)
+class RuntimeConfig:
+    """启动时从 ConfigManager 一次性解析出的运行参数。"""
+
+    transport_type: str
+    server_host: str
+    server_port: int
+    allow_instance_management: bool
+    timeout: float
+    idle_timeout: float
+    data_path: str
+    watcher_enabled: bool
+    debounce_delay: float
+    bearer_token: str | None
+    enable_validation: bool
+    api_enabled: bool
+    api_host: str
+    api_port: int
+    api_auto_find_port: bool
+    api_cors_origin: str
+    api_enable_realtime_logs: bool
+    log_level: str
+    log_format: str | None
+    log_directory: str
+
+    @classmethod
+    def from_config(cls, config: ConfigManager, transport_type: str) -> "RuntimeConfig":
+        """从配置管理器构建运行参数。
+
+        Args:
+            config: Configuration manager
+            transport_type: MCP 传输模式（stdio/http/sse）
+
+        Returns:
+            RuntimeConfig 实例
+        """
+        # SSE/HTTP需要host和port - 根据传输模式获取对应端口
+        default_ports = {"http": 3000, "sse": 3001}
+        return cls(
+            transport_type=transport_type,
+            server_host=config.get("server.host", "127.0.0.1"),
+            server_port=config.get(
+                f"server.{transport_type}.port", default_ports.get(transport_type, 3000)
+            ),
+            allow_instance_management=config.get("server.allow_instance_management", False),
+            timeout=config.get("mcp_client.timeout", 30.0),
+            idle_timeout=config.get("mcp_client.idle_timeout", 0),
+            data_path=config.get("watcher.watch_path", "data"),
+            watcher_enabled=config.get("watcher.enabled", True),
+            debounce_delay=config.get("watcher.debounce_delay", 1.0),
+            bearer_token=config.get("security.bearer_token"),
+            enable_validation=config.get("security.enable_validation", True),
+            api_enabled=config.get("api.enabled", False),
+            api_host=config.get("api.host", "127.0.0.1"),
+            api_port=config.get("api.port", 8000),
+            api_auto_find_port=config.get("api.auto_find_port", True),
+            api_cors_origin=config.get("api.cors_origin", "*"),
+            api_enable_realtime_logs=config.get("api.enable_realtime_logs", False),
+            log_level=config.get("logging.level", "INFO"),
             log_format=config.get("logging.format"),
+            log_directory=config.get("logging.directory", "logs"),
         )
-        logger.info("WebSocket realtime logging enabled")
 
-    app = create_app(
-        mcp_router=router,
-        security_manager=security_manager,
-        cors_origin=config.get("api.cors_origin", "*"),
-        enable_realtime_logs=enable_realtime_logs,
-    )
 
-    host = config.get("api.host", "127.0.0.1")
-    start_port = config.get("api.port", 8000)
-    auto_find_port = config.get("api.auto_find_port", True)
+@dataclass
+class AppContext:
+    """各运行模式共享的核心组件。"""
 
-    # 查找可用端口
-    if auto_find_port:
-        port = find_available_port(host, start_port)
-        if port != start_port:
-            logger.warning(f"端口 {start_port} 不可用，使用端口 {port}")
-    else:
-        port = start_port
+    client_manager: MCPClientManager
+    router: MCPRouter
+    load_task: "asyncio.Task | None" = None
+    watcher: "FileWatcher | None" = None
+    watcher_queue: Any = None
+    stop_event: asyncio.Event = field(default_factory=asyncio.Event)
 
-    logger.info(f"API server ready at {host}:{port} - starting service...")
 
-    uvicorn_config = uvicorn.Config(app, host=host, port=port, log_level="info")
-    server = uvicorn.Server(uvicorn_config)
+@asynccontextmanager
+async def app_context(cfg: RuntimeConfig):
+    """创建客户端管理器、路由器和文件监视器，并在退出时统一清理。
 
-    async def load_clients_in_background():
-        """在后台加载客户端配置"""
-        try:
-            await client_manager.load_configurations()
-            logger.info("All MCP client instances loaded in background")
-        except Exception as e:
-            logger.error(f"Error loading MCP clients: {e}", exc_info=True)
+    Args:
+        cfg: Runtime configuration
+
+    Yields:
+        AppContext 实例
+    """
+    global _watcher, _client_manager
+
+    # 初始化管理器
+    client_manager = MCPClientManager(
+        data_path=cfg.data_path, timeout=cfg.timeout, idle_timeout=cfg.idle_timeout
+    )
+    _client_manager = client_manager
+    ctx = AppContext(client_manager=client_manager, router=MCPRouter(client_manager))
+    _install_signal_handlers(ctx.stop_event)
 
-    # 并发运行：API 服务器 + 后台加载客户端 + 配置监视
-    tasks = [server.serve(), load_clients_in_background()]
-    if watcher_queue:
-        tasks.append(poll_watcher_queue(watcher_queue, client_manager))
+    # 最先启动后台加载客户端任务，使连接建立与 watcher 子进程、服务器初始化同时进行
+    # （启用 eager task factory 时会立即执行到第一次等待）
+    ctx.load_task = asyncio.create_task(_load_clients(client_manager), name="load_clients")
+    client_manager.start_idle_reaper()
 
     try:
-        await asyncio.gather(*tasks)
-    except (KeyboardInterrupt, SystemExit):
-        logger.info("Shutting down API server...")
-    finally:
-        # 清理资源，使用超时保护确保不会卡住
-        cleanup_tasks = []
+        if cfg.watcher_enabled:
+            from src.utils.watcher import FileWatcher
 
-        if watcher:
-            try:
-                watcher.stop()
-            except Exception as e:
-                logger.error(f"Error stopping watcher: {e}")
+            ctx.watcher = FileWatcher(watch_path=cfg.data_path, debounce_delay=cfg.debounce_delay)
+            _watcher = ctx.watcher
+            ctx.watcher_queue = ctx.watcher.start()
 
-        if client_manager:
-            cleanup_tasks.append(client_manager.shutdown())
+        yield ctx
+    finally:
+        ctx.load_task.cancel()
 
-        # 等待清理完成，最多等待10秒
-        if cleanup_tasks:
+        # 清理资源，使用超时保护确保不会卡住
+        if ctx.watcher:
             try:
-                await asyncio.wait_for(
-                    asyncio.gather(*cleanup_tasks, return_exceptions=True), timeout=10.0
-                )
-            except asyncio.TimeoutError:
-                logger.warning("Cleanup timeout, forcing exit")
+                ctx.watcher.stop()
             except Exception as e:
-                logger.error(f"Error during cleanup: {e}")
+                logger.error("Error stopping watcher: %s", e)
+
+        # 等待清理完成，最多等待10秒（shutdown 内部已汇总各实例的异常，无需再套 gather）
+        try:
+            await asyncio.wait_for(client_manager.shutdown(), timeout=10.0)
+        except asyncio.TimeoutError:
+            logger.warning("Cleanup timeout, forcing exit")
+        except Exception as e:
+            logger.error("Error during cleanup: %s", e)
 
 
-async def run_combined_mode(config: ConfigManager):
-    """Run both MCP server and API server.
+async def _serve_mcp(ctx: AppContext, cfg: RuntimeConfig) -> None:
+    """Run the MCP server with the configured transport.
 
     Args:
-        config: Configuration manager
+        ctx: Shared application components
+        cfg: Runtime configuration
     """
-    global _watcher, _client_manager
+    transport_type = cfg.transport_type
+    allow_management = cfg.allow_instance_management
+    server = MCPServer(
+        ctx.router,
+        name="mcp_router",
+        allow_instance_management=allow_management,
+        transport_type=transport_type,
+    )
+    logger.info(
+        "MCP Server ready - starting service... (management: %s, transport: %s)",
+        allow_management,
+        transport_type,
+    )
 
-    logger.info("Starting MCP Router in COMBINED mode...")
+    if transport_type == "stdio":
+        await server.run()
+    else:
+        host, port = cfg.server_host, cfg.server_port
+        logger.info("MCP Server listening on %s:%s (%s mode)", host, port, transport_type)
+        await server.run(host, port)
 
-    timeout = config.get("mcp_client.timeout", 30.0)
-    data_path = config.get("watcher.watch_path", "data")
 
-    # 初始化管理器
-    client_manager = MCPClientManager(data_path=data_path, timeout=timeout)
-    _client_manager = client_manager
-    router = MCPRouter(client_manager)
+async def _serve_api(ctx: AppContext, cfg: RuntimeConfig) -> None:
+    """Run the HTTP API server.
+
+    Args:
+        ctx: Shared application components
+        cfg: Runtime configuration
+    """
+    import uvicorn
+
+    from src.api.app import create_app
 
     security_manager = SecurityManager(
-        bearer_token=config.get("security.bearer_token"),
-        enable_validation=config.get("security.enable_validation", True),
+        bearer_token=cfg.bearer_token,
+        enable_validation=cfg.enable_validation,
     )
 
-    watcher = None
-    watcher_queue = None
-
-    if config.get("watcher.enabled", True):
-        watcher = FileWatcher(
-            watch_path=data_path,
-            debounce_delay=config.get("watcher.debounce_delay", 1.0),
-        )
-        _watcher = watcher
-        watcher_queue = watcher.start()
-
-    async def run_mcp():
-        """Run MCP server."""
-        allow_management = config.get("server.allow_instance_management", False)
-        transport_type = config.get("server.transport_type", "stdio")
-        host = config.get("server.host", "127.0.0.1")
-
-        server = MCPServer(
-            router,
-            name="mcp_router",
-            allow_instance_management=allow_management,
-            transport_type=transport_type,
-        )
-        if transport_type == "stdio":
-            await server.run()
-        else:
-            # 根据传输模式获取对应端口
-            port_key = f"server.{transport_type}.port"
-            default_ports = {"http": 3000, "sse": 3001}
-            port = config.get(port_key, default_ports.get(transport_type, 3000))
-            logger.info(f"MCP Server listening on {host}:{port} ({transport_type} mode)")
-            await server.run(host, port)
+    enable_realtime_logs = cfg.api_enable_realtime_logs
 
-    async def run_api():
-        """Run API server."""
-        from src.api.app import create_app
+    # 如果启用WebSocket实时日志，添加日志处理器
+    if enable_realtime_logs:
+        from src.utils.websocket_logger import enable_websocket_logging
 
-        enable_realtime_logs = config.get("api.enable_realtime_logs", False)
+        enable_websocket_logging(
+            level=cfg.log_level,
+            log_format=cfg.log_format,
+        )
+        logger.info("WebSocket realtime logging enabled")
 
-        # 如果启用WebSocket实时日志，添加日志处理器
-        if enable_realtime_logs:
-            from src.utils.websocket_logger import enable_websocket_logging
+    app = create_app(
+        mcp_router=ctx.router,
+        security_manager=security_manager,
+        cors_origin=cfg.api_cors_origin,
+        enable_realtime_logs=enable_realtime_logs,
+    )
 
-            enable_websocket_logging(
-                level=config.get("logging.level", "INFO"),
-                log_format=config.get("logging.format"),
-            )
-            logger.info("WebSocket realtime logging enabled")
+    host = cfg.api_host
+    start_port = cfg.api_port
 
-        app = create_app(
-            mcp_router=router,
-            security_manager=security_manager,
-            cors_origin=config.get("api.cors_origin", "*"),
-            enable_realtime_logs=enable_realtime_logs,
-        )
+    # 绑定监听端口（必要时由系统分配），并把套接字直接交给 uvicorn
+    sock = bind_api_socket(host, start_port, cfg.api_auto_find_port)
+    port = sock.getsockname()[1]
+    if port != start_port:
+        logger.warning("端口 %s 不可用，使用端口 %s", start_port, port)
 
-        host = config.get("api.host", "127.0.0.1")
-        start_port = config.get("api.port", 8000)
-        auto_find_port = config.get("api.auto_find_port", True)
+    logger.info("API server listening on %s:%s", host, port)
 
-        # 查找可用端口
-        if auto_find_port:
-            port = find_available_port(host, start_port)
-            if port != start_port:
-                logger.warning(f"端口 {start_port} 不可用，使用端口 {port}")
-        else:
-            port = start_port
+    uvicorn_config = uvicorn.Config(app, host=host, port=port, log_level="info")
+    server = uvicorn.Server(uvicorn_config)
+    try:
+        await server.serve(sockets=[sock])
+    finally:
+        sock.close()
+        if enable_realtime_logs:
+            from src.utils.websocket_logger import disable_websocket_logging
 
-        logger.info(f"API server listening on {host}:{port}")
+            disable_websocket_logging()
 
-        uvicorn_config = uvicorn.Config(app, host=host, port=port, log_level="info")
-        server = uvicorn.Server(uvicorn_config)
-        await server.serve()
 
-    # MCP Server + API立即启动，不等待客户端加载
-    logger.info("MCP Server + API ready - starting services...")
+async def _run_until_stopped(tasks: list[asyncio.Task], stop_event: asyncio.Event) -> None:
+    """运行任务直到全部完成、任一任务出错或 stop_event 被设置，然后取消其余任务并等待其退出。
 
-    async def load_clients_in_background():
-        """在后台加载客户端配置"""
-        try:
-            await client_manager.load_configurations()
-            logger.info("All MCP client instances loaded in background")
-        except Exception as e:
-            logger.error(f"Error loading MCP clients: {e}", exc_info=True)
+    与 asyncio.TaskGroup（Python 3.11+）语义一致，兼容 Python 3.10。
 
-    tasks = [run_mcp(), run_api(), load_clients_in_background()]
-    if watcher_queue:
-        tasks.append(poll_watcher_queue(watcher_queue, client_manager))
+    Args:
+        tasks: 要并发运行的任务
+        stop_event: 请求停止时设置的事件
 
+    Raises:
+        Exception: 第一个失败任务抛出的异常
+    """
+    stop_task = asyncio.create_task(stop_event.wait(), name="stop")
+    pending = {stop_task, *tasks}
     try:
-        await asyncio.gather(*tasks)
-    except (KeyboardInterrupt, SystemExit):
-        logger.info("Shutting down MCP Router...")
+        while stop_task in pending and len(pending) > 1:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task is not stop_task and not task.cancelled() and task.exception() is not None:
+                    raise task.exception()
     finally:
-        # 清理资源，使用超时保护确保不会卡住
-        cleanup_tasks = []
+        stop_task.cancel()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(stop_task, *tasks, return_exceptions=True)
 
-        if watcher:
-            try:
-                watcher.stop()
-            except Exception as e:
-                logger.error(f"Error stopping watcher: {e}")
-
-        if client_manager:
-            cleanup_tasks.append(client_manager.shutdown())
 
-        # 等待清理完成，最多等待10秒
-        if cleanup_tasks:
-            try:
-                await asyncio.wait_for(
-                    asyncio.gather(*cleanup_tasks, return_exceptions=True), timeout=10.0
-                )
-            except asyncio.TimeoutError:
-                logger.warning("Cleanup timeout, forcing exit")
-            except Exception as e:
-                logger.error(f"Error during cleanup: {e}")
-
-
-def parse_args_for_help():
-    """显示帮助信息"""
-    parser = argparse.ArgumentParser(
-        description="MCP Router - A routing/proxy system for MCP servers",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-示例:
-  # Stdio模式（默认，用于Cursor/Claude Desktop）
-  python main.py
-  python main.py stdio
+async def run(cfg: RuntimeConfig, *, mcp: bool, api: bool) -> None:
+    """Run the MCP server, the API server, or both.
 
-  # HTTP模式（多客户端）
-  python main.py http
+    Args:
+        cfg: Runtime configuration
+        mcp: Start the MCP server
+        api: Start the HTTP API server
+    """
+    _enable_eager_tasks()
 
-  # SSE模式（实时推送）
-  python main.py sse
+    if mcp and api:
+        logger.info("Starting MCP Router in COMBINED mode...")
+    elif api:
+        logger.info("Starting MCP Router in API mode...")
+    else:
+        logger.info("Starting MCP Router in SERVER mode (%s)...", cfg.transport_type)
+
+    async with app_context(cfg) as ctx:
+        # 服务立即启动，不等待客户端加载；并发运行：服务 + 后台加载客户端 + 配置监视
+        tasks = [ctx.load_task]
+        if mcp:
+            tasks.append(asyncio.create_task(_serve_mcp(ctx, cfg), name="mcp_server"))
+        if api:
+            tasks.append(asyncio.create_task(_serve_api(ctx, cfg), name="api_server"))
+        if ctx.watcher_queue:
+            tasks.append(
+                asyncio.create_task(
+                    poll_watcher_queue(ctx.watcher_queue, ctx.client_manager), name="watcher"
+                )
+            )
 
-  # API服务器模式（单独启动，无论配置如何）
-  python main.py api
+        try:
+            await _run_until_stopped(tasks, ctx.stop_event)
+        except (asyncio.CancelledError, KeyboardInterrupt):
+            # 不支持事件循环信号处理的平台上仍由 KeyboardInterrupt 触发关闭
+            pass
+        logger.info("Shutting down MCP Router...")
 
-  # 显示帮助信息
-  python main.py help
 
-注意：
-  - 传输模式默认为stdio
-  - API服务器是否启动由config.json中的api.enabled决定（除非使用 api 参数）
-  - HTTP/SSE的host和port在config.json中配置
-        """,
-    )
+class _VersionAction(argparse.Action):
+    """--version 参数：仅在实际请求时才读取包版本"""
 
-    parser.add_argument(
-        "transport",
-        nargs="?",
-        default="stdio",
-        choices=["stdio", "http", "sse", "api", "help", "add"],
-        help="MCP传输模式或命令 (默认: stdio)",
-    )
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS, help=None):
+        super().__init__(
+            option_strings=option_strings,
+            dest=dest,
+            default=default,
+            nargs=0,
+            help=help or "show program's version number and exit",
+        )
 
-    parser.add_argument(
-        "-c",
-        "--config",
-        metavar="FILE",
-        default="config.json",
-        help="配置文件路径 (默认: config.json)",
-    )
+    def __call__(self, parser, namespace, values, option_string=None):
+        parser.exit(message=f"MCP Router v{src.__version__}\n")
 
-    parser.add_argument(
-        "-l",
-        "--log-level",
-        metavar="LEVEL",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL", "OFF"],
-        help="日志级别",
-    )
 
-    parser.add_argument("-v", "--version", action="version", version=f"MCP Router v{__version__}")
+_PARSER: argparse.ArgumentParser | None = None
 
-    parser.print_help()
 
+def _build_parser() -> argparse.ArgumentParser:
+    """构建命令行参数解析器（仅构建一次并缓存）"""
+    global _PARSER
+    if _PARSER is not None:
+        return _PARSER
 
-def parse_args():
-    """解析命令行参数，返回(已知参数, 其余位置参数)"""
     parser = argparse.ArgumentParser(
         description="MCP Router - A routing/proxy system for MCP servers",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -608,15 +760,33 @@ def parse_args():
         help="日志级别",
     )
 
-    parser.add_argument("-v", "--version", action="version", version=f"MCP Router v{__version__}")
+    parser.add_argument("-v", "--version", action=_VersionAction)
+
+    _PARSER = parser
+    return parser
+
 
+def parse_args_for_help():
+    """显示帮助信息"""
+    _build_parser().print_help()
+
+
+def parse_args():
+    """解析命令行参数，返回(已知参数, 其余位置参数)"""
     # 允许在 add 命令后附加位置参数，不作为未知参数报错
-    args, extra = parser.parse_known_args()
+    args, extra = _build_parser().parse_known_args()
     return args, extra
 
 
 def main():
     """Main entry point."""
+    # 注册清理函数
+    atexit.register(cleanup)
+
+    # 注册信号处理（支持两次 Ctrl+C）
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
+
     try:
         # 解析命令行参数（兼容 add 的附加位置参数）
         args, extra_args = parse_args()
@@ -647,55 +817,62 @@ def main():
             display_name = extra_args[2] if len(extra_args) >= 3 else instance_name
 
             # 硬性规定：文件夹名称为实例名称，且不得包含中文（仅允许 a-zA-Z0-9_-）
-            # 先校验 provider 命名合法性（不含中文）
-            InputValidator.validate_provider_name(provider_name)
-            # 实例名称必须与文件夹名称一致，且也使用 provider 规则校验，保证不含中文
+            # 实例名称必须与文件夹名称一致，因此只需按 provider 规则校验一次
             if instance_name != provider_name:
                 raise ValueError(
                     f"实例名称必须与文件夹名称一致: 实例='{instance_name}', 文件夹='{provider_name}'"
                 )
-            InputValidator.validate_provider_name(instance_name)
+            InputValidator.validate_provider_name(provider_name)
 
             # 校验 provider 目录与文件
             data_dir = Path(config.get("watcher.watch_path", "data"))
             provider_dir = data_dir / provider_name
             settings_path = provider_dir / "mcp_settings.json"
 
-            if not settings_path.exists():
+            # 目标配置只读取一次，后续解析直接使用这份内容
+            try:
+                raw = settings_path.read_bytes().strip()
+            except FileNotFoundError:
                 raise FileNotFoundError(
                     f"未找到配置文件: {settings_path}. 请确保文件存在且命名为 mcp_settings.json"
-                )
+                ) from None
 
             # 收集现有实例名称，确保唯一（排除当前文件）
             # 注意：检查的是 name 字段的唯一性（可能包含中文），不是 instance_name
-            existing_names: set[str] = set()
-            for cfg_file in data_dir.glob("*/mcp_settings.json"):
-                # 排除当前正在处理的文件
-                if cfg_file == settings_path:
-                    continue
-                try:
-                    content = cfg_file.read_text(encoding="utf-8").strip()
-                    if not content:
+            # 已解析过且未修改的文件（按 mtime/size 判断）直接使用缓存中的 name
+            cache_path = data_dir.parent / ".cache" / "mcp_names.json"
+            old_cache = _load_name_cache(cache_path)
+            new_cache: dict[str, list] = {}
+            # name -> provider，用于 O(1) 查重并在冲突时指出占用该名称的目录
+            existing_names: dict[str, str] = {}
+            with os.scandir(data_dir) as entries:
+                for entry in entries:
+                    # 排除当前正在处理的文件所在目录
+                    if entry.name == provider_name or not entry.is_dir():
+                        continue
+                    cfg_file = os.path.join(entry.path, "mcp_settings.json")
+                    try:
+                        name = _cached_config_name(cfg_file, old_cache, new_cache)
+                    except OSError:
+                        # 目录中没有 mcp_settings.json
                         continue
-                    data = json.loads(content)
-                    name = _extract_name_from_config(data)
                     if name:
-                        existing_names.add(name)
-                except Exception:
-                    # 跳过损坏/非法配置文件
-                    continue
+                        existing_names.setdefault(name, entry.name)
 
             if display_name in existing_names:
-                raise ValueError(f"实例名称已存在: {display_name}")
+                if new_cache != old_cache:
+                    _save_name_cache(cache_path, new_cache)
+                raise ValueError(
+                    f"实例名称已存在: {display_name} (provider: {existing_names[display_name]})"
+                )
 
-            # 读取目标配置并写入 name 字段
-            raw = settings_path.read_text(encoding="utf-8").strip()
+            # 解析目标配置并写入 name 字段
             if not raw:
                 raise ValueError(f"配置文件为空: {settings_path}")
 
             try:
-                obj = json.loads(raw)
-            except json.JSONDecodeError as e:
+                obj = jsonio.loads(raw)
+            except jsonio.JSONDecodeError as e:
                 raise ValueError(f"配置文件 JSON 解析失败: {e}") from e
 
             updated = False
@@ -759,32 +936,38 @@ def main():
 
                 # 统一输出为顶层对象格式（项目标准格式）
                 # 按标准字段顺序重新组织：name, type, command, args, env, isActive, provider
-                ordered_obj = {}
-                field_order = ["name", "type", "command", "args", "env", "isActive", "provider"]
-
-                # 按顺序添加字段
-                for field in field_order:
-                    if field in server_cfg:
-                        ordered_obj[field] = server_cfg[field]
-
+                ordered_obj = {
+                    field: server_cfg[field]
+                    for field in _SETTINGS_FIELD_ORDER
+                    if field in server_cfg
+                }
                 # 添加其他未列出的字段（metadata等）
-                for key, value in server_cfg.items():
-                    if key not in field_order:
-                        ordered_obj[key] = value
+                ordered_obj.update(
+                    (key, value)
+                    for key, value in server_cfg.items()
+                    if key not in _SETTINGS_FIELDS
+                )
 
                 obj = ordered_obj
 
             # 总是写入规范化后的配置，确保字段顺序正确
-            settings_path.write_text(
-                json.dumps(obj, ensure_ascii=False, indent=2), encoding="utf-8"
-            )
+            jsonio.dump_file(settings_path, obj, indent=True)
+
+            # 将刚写入的配置也记入缓存，批量 add 时下一次扫描无需重新解析该文件
+            st = settings_path.stat()
+            new_cache[str(settings_path)] = [st.st_mtime_ns, st.st_size, display_name]
+            if new_cache != old_cache:
+                _save_name_cache(cache_path, new_cache)
             if updated:
                 logger.info(
-                    f"已更新 {settings_path}，规范化配置完成 (name: '{display_name}', provider: '{provider_name}')"
+                    "已更新 %s，规范化配置完成 (name: '%s', provider: '%s')",
+                    settings_path,
+                    display_name,
+                    provider_name,
                 )
             else:
                 logger.info(
-                    f"{settings_path} 配置已规范化，字段顺序已调整 (name: '{display_name}')"
+                    "%s 配置已规范化，字段顺序已调整 (name: '%s')", settings_path, display_name
                 )
 
             return
@@ -797,30 +980,32 @@ def main():
             # 其他模式使用传输类型作为日志文件名标识
             log_mode = transport_type
 
+        # 启动前一次性解析运行参数，之后不再读取 ConfigManager
+        cfg = RuntimeConfig.from_config(config, transport_type)
+
         # 日志配置（命令行优先，传入log_mode用于日志文件命名）
-        log_level = args.log_level or config.get("logging.level", "INFO")
         setup_logging(
-            level=log_level,
-            log_format=config.get("logging.format"),
-            log_directory=config.get("logging.directory", "logs"),
+            level=args.log_level or cfg.log_level,
+            log_format=cfg.log_format,
+            log_directory=cfg.log_directory,
             transport_mode=log_mode,  # 传递模式给日志系统
         )
 
         logger.info("=" * 60)
-        logger.info(f"MCP Router v{__version__}")
+        logger.info("MCP Router v%s", src.__version__)
         logger.info("=" * 60)
 
         # 如果是 api 命令，直接启动 API 服务器
         if transport_type == "api":
             logger.info("Mode: API ONLY (forced by command line)")
-            asyncio.run(run_api_server(config))
+            _run_event_loop(run(cfg, mcp=False, api=True))
             return
 
         # 确定运行模式
         # MCP服务器始终启动（使用命令行指定的传输模式）
         server_enabled = True
         # API服务器根据配置文件决定
-        api_enabled = config.get("api.enabled", False)
+        api_enabled = cfg.api_enabled
 
         if server_enabled and api_enabled:
             mode = "combined"
@@ -829,23 +1014,17 @@ def main():
 
         # 显示运行模式
         if mode == "combined":
-            logger.info(f"Mode: COMBINED (MCP Server [{transport_type}] + API)")
+            logger.info("Mode: COMBINED (MCP Server [%s] + API)", transport_type)
         else:
-            logger.info(f"Mode: MCP SERVER ({transport_type})")
-
-        # 覆盖配置文件中的传输类型
-        config._config["server"]["transport_type"] = transport_type
+            logger.info("Mode: MCP SERVER (%s)", transport_type)
 
         # 运行对应模式
-        if mode == "combined":
-            asyncio.run(run_combined_mode(config))
-        else:
-            asyncio.run(run_mcp_server(config))
+        _run_event_loop(run(cfg, mcp=server_enabled, api=api_enabled))
 
     except (KeyboardInterrupt, SystemExit):
         logger.info("Shutting down gracefully...")
     except Exception as e:
-        logger.error(f"Fatal error: {e}", exc_info=True)
+        logger.error("Fatal error: %s", e, exc_info=True)
         sys.exit(1)
 
 
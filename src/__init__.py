@@ -1,10 +1,27 @@
 """MCP Router - A routing/proxy system for MCP servers."""
 
-try:
-    from importlib.metadata import version
+from typing import Any
 
-    __version__ = version("mcp-router")
-except Exception:
-    __version__ = "1.0.9"  # Fallback version
+_FALLBACK_VERSION = "1.0.9"
 
 __all__ = ["__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``__version__`` on first access (PEP 562).
+
+    Reading installed package metadata scans ``sys.path``, so it is deferred
+    until the version is actually needed and then cached as a module global.
+    """
+    if name != "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        from importlib.metadata import version
+
+        value = version("mcp-router")
+    except Exception:
+        value = _FALLBACK_VERSION  # Fallback version
+
+    globals()[name] = value
+    return value
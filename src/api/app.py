@@ -1,60 +1,166 @@
 """FastAPI application setup."""
 
-from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+import asyncio
+from collections.abc import Sequence
+
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from .. import __version__
+from ..core.jsonio import ORJSON_AVAILABLE
 from ..core.logger import get_logger
 from ..mcp.router import MCPRouter
 from ..utils.security import SecurityManager
 from ..utils.websocket_logger import get_websocket_handler
-from .routes import create_router
+from .routes import router as api_router
 
 logger = get_logger(__name__)
 
+# Serialize API responses with orjson when the optional dependency is installed
+_DEFAULT_RESPONSE_CLASS = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+
+# Encoded once at import; appended to every HTTP response start message
+_SECURITY_HEADERS: tuple[tuple[bytes, bytes], ...] = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+    (b"content-security-policy", b"default-src 'self'"),
+)
+
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Middleware to add security headers to responses."""
+class SecurityHeadersMiddleware:
+    """ASGI middleware to add security headers to HTTP responses."""
 
-    async def dispatch(self, request: Request, call_next):
-        """Add security headers to response."""
-        response = await call_next(request)
+    def __init__(self, app: ASGIApp):
+        """Initialize middleware.
 
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        response.headers["Content-Security-Policy"] = "default-src 'self'"
+        Args:
+            app: Wrapped ASGI application
+        """
+        self.app = app
 
-        return response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Add security headers to the response start message."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *_SECURITY_HEADERS]
+            await send(message)
 
-class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
-    """Middleware to limit request body size."""
+        await self.app(scope, receive, send_with_headers)
 
-    def __init__(self, app, max_size: int = 10 * 1024 * 1024):
+
+_HEALTH_BODY = b'{"status":"healthy"}'
+_HEALTH_START: Message = {
+    "type": "http.response.start",
+    "status": 200,
+    "headers": [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(_HEALTH_BODY)).encode()),
+        *_SECURITY_HEADERS,
+    ],
+}
+_HEALTH_BODY_MESSAGE: Message = {"type": "http.response.body", "body": _HEALTH_BODY}
+
+
+class FastHealthMiddleware:
+    """ASGI middleware answering ``GET /health`` before any other middleware or routing.
+
+    Liveness probes hit this endpoint constantly; the response is fixed, so it is
+    pre-encoded once and sent directly. Since CORSMiddleware never sees these
+    requests, the CORS response headers it would add are reproduced here.
+    """
+
+    def __init__(
+        self, app: ASGIApp, allow_origins: Sequence[str] = (), allow_credentials: bool = False
+    ):
+        """Initialize middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            allow_origins: Origins allowed by the CORS configuration ("*" for any)
+            allow_credentials: Whether the CORS configuration allows credentials
+        """
+        self.app = app
+        self.allow_all_origins = "*" in allow_origins
+        self.allow_origins = frozenset(origin.encode("latin-1") for origin in allow_origins)
+        self._credentials_headers: tuple[tuple[bytes, bytes], ...] = (
+            ((b"access-control-allow-credentials", b"true"),) if allow_credentials else ()
+        )
+        self._any_origin_start: Message = {
+            **_HEALTH_START,
+            "headers": [
+                *_HEALTH_START["headers"],
+                *self._credentials_headers,
+                (b"access-control-allow-origin", b"*"),
+            ],
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Send the health response, or pass the request through."""
+        if scope["type"] == "http" and scope["path"] == "/health" and scope["method"] == "GET":
+            await send(self._start_message(scope))
+            await send(_HEALTH_BODY_MESSAGE)
+            return
+
+        await self.app(scope, receive, send)
+
+    def _start_message(self, scope: Scope) -> Message:
+        """Pick the response start message, adding CORS headers like CORSMiddleware."""
+        origin = None
+        has_cookie = False
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"cookie":
+                has_cookie = True
+        if origin is None:
+            return _HEALTH_START
+
+        # Same rules as CORSMiddleware: "*" unless cookies are sent, else echo allowed origins
+        if self.allow_all_origins and not has_cookie:
+            return self._any_origin_start
+        headers = [*_HEALTH_START["headers"], *self._credentials_headers]
+        if self.allow_all_origins or origin in self.allow_origins:
+            headers.append((b"access-control-allow-origin", origin))
+            headers.append((b"vary", b"Origin"))
+        return {**_HEALTH_START, "headers": headers}
+
+
+class RequestSizeLimitMiddleware:
+    """ASGI middleware to limit request body size."""
+
+    def __init__(self, app: ASGIApp, max_size: int = 10 * 1024 * 1024):
         """Initialize middleware.
 
         Args:
-            app: FastAPI application
+            app: Wrapped ASGI application
             max_size: Maximum request body size in bytes (default: 10MB)
         """
-        super().__init__(app)
+        self.app = app
         self.max_size = max_size
 
-    async def dispatch(self, request: Request, call_next):
-        """Check request body size."""
-        if request.method in ["POST", "PUT", "PATCH"]:
-            content_length = request.headers.get("content-length")
-            if content_length and int(content_length) > self.max_size:
-                return Response(
-                    content=f"Request body too large. Maximum size: {self.max_size} bytes",
-                    status_code=413,
-                )
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Check request body size from the Content-Length header."""
+        if scope["type"] == "http" and scope["method"] in ("POST", "PUT", "PATCH"):
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    if value.isdigit() and int(value) > self.max_size:
+                        response = Response(
+                            content=f"Request body too large. Maximum size: {self.max_size} bytes",
+                            status_code=413,
+                        )
+                        await response(scope, receive, send)
+                        return
+                    break
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
 
 
 def create_app(
@@ -79,12 +185,13 @@ def create_app(
         FastAPI application
     """
     if version is None:
-        version = __version__
+        from .. import __version__ as version
 
     app = FastAPI(
         title=title,
         version=version,
         description="REST API for managing MCP Router instances and tools",
+        default_response_class=_DEFAULT_RESPONSE_CLASS,
     )
 
     origins = []
@@ -95,18 +202,28 @@ def create_app(
     else:
         origins = [cors_origin]
 
+    # Explicit methods/headers keep the preflight response stable so browsers can cache
+    # it for max_age seconds. Credentials are only allowed for explicit origins: with
+    # "*" Starlette would echo each Origin back with "Vary: Origin", defeating caches.
     app.add_middleware(
         CORSMiddleware,
         allow_origins=origins,
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_credentials=origins != ["*"],
+        allow_methods=["GET", "POST", "PATCH", "DELETE"],
+        allow_headers=["authorization", "content-type"],
+        max_age=86400,
     )
 
     app.add_middleware(SecurityHeadersMiddleware)
     app.add_middleware(RequestSizeLimitMiddleware, max_size=10 * 1024 * 1024)
+    # Added last so it is the outermost middleware
+    app.add_middleware(
+        FastHealthMiddleware, allow_origins=origins, allow_credentials=origins != ["*"]
+    )
 
-    api_router = create_router(mcp_router, security_manager)
+    # Read by the module-level API dependencies
+    app.state.mcp_router = mcp_router
+    app.state.security_manager = security_manager
     app.include_router(api_router, prefix="/api")
 
     @app.get("/")
@@ -116,7 +233,7 @@ def create_app(
 
     @app.get("/health")
     async def health():
-        """Health check endpoint."""
+        """Health check endpoint (GET is answered by FastHealthMiddleware)."""
         return {"status": "healthy"}
 
     # WebSocket实时日志端点（如果启用）
@@ -130,27 +247,35 @@ def create_app(
             """
             await websocket.accept()
             ws_handler = get_websocket_handler()
-            await ws_handler.add_client(websocket)
+            client_queue = await ws_handler.add_client(websocket)
+            pump_task: asyncio.Task | None = None
 
             logger.info(f"WebSocket client connected: {websocket.client}")
 
             try:
-                # 保持连接并发送欢迎消息
-                await websocket.send_text(
+                # 欢迎消息放在队列最前面，与已积压的日志合并为一次发送
+                client_queue.put_nowait(
                     f"Connected to {title} v{version} - Realtime Logs\n"
-                    f"----------------------------------------\n"
+                    f"----------------------------------------"
                 )
+                pump_task = asyncio.create_task(ws_handler.pump(websocket, client_queue))
 
                 # 保持连接直到客户端断开
+                # 只检查消息类型，不解码客户端发来的负载
                 while True:
-                    # 等待客户端消息（主要用于检测断开连接）
-                    await websocket.receive_text()
+                    message = await websocket.receive()
+                    if message["type"] == "websocket.disconnect":
+                        break
+
+                logger.info(f"WebSocket client disconnected: {websocket.client}")
 
             except WebSocketDisconnect:
                 logger.info(f"WebSocket client disconnected: {websocket.client}")
             except Exception as e:
                 logger.error(f"WebSocket error: {e}")
             finally:
+                if pump_task is not None:
+                    pump_task.cancel()
                 await ws_handler.remove_client(websocket)
 
         logger.info("WebSocket realtime logs enabled at /ws")
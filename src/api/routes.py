@@ -1,11 +1,18 @@
 """API route handlers."""
 
-from typing import Any
-
-from fastapi import APIRouter, Depends, Header, HTTPException
-from pydantic import BaseModel, Field, field_validator
-
-from ..core.exceptions import MCPRouterException, ValidationError
+import re
+from collections.abc import Awaitable, Callable
+from typing import Annotated, Any, TypeVar
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import ValidationError as PydanticValidationError
+from starlette.exceptions import HTTPException as StarletteHTTPException
+
+from ..core.exceptions import MCPRouterException, SecurityError, ValidationError
 from ..core.logger import get_logger
 from ..mcp.router import MCPRouter
 from ..utils.security import SecurityManager
@@ -13,10 +20,25 @@ from ..utils.validator import InputValidator
 
 logger = get_logger(__name__)
 
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+_BEARER_PREFIX = "Bearer "
+
+# Listings may be cached by the client but must be revalidated with If-None-Match
+_LISTING_CACHE_CONTROL = "private, no-cache"
+
+_VALID_TRANSPORT_TYPES = frozenset({"stdio", "sse", "http"})
+
+# Characters/sequences not allowed in tool names, matched in one C-level scan
+_TOOL_NAME_DANGEROUS = re.compile(r"[/\\;|&$`]|\.\.")
+
 
 class InstanceConfig(BaseModel):
     """MCP instance configuration model."""
 
+    # Validated once on parse; instances are never mutated afterwards
+    model_config = ConfigDict(frozen=True)
+
     provider: str = Field(..., description="Provider name", max_length=100)
     name: str = Field(..., description="Instance name", max_length=100)
     type: str = Field(..., description="Transport type (stdio, sse, http)")
@@ -26,43 +48,19 @@ class InstanceConfig(BaseModel):
     isActive: bool = Field(default=True, description="Whether instance is active")
     metadata: dict[str, Any] | None = Field(default=None, description="Additional metadata")
 
-    @field_validator("provider")
-    @classmethod
-    def validate_provider(cls, v: str) -> str:
-        """Validate provider name."""
-        return InputValidator.validate_provider_name(v)
-
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        """Validate instance name."""
-        return InputValidator.validate_instance_name(v)
-
-    @field_validator("type")
-    @classmethod
-    def validate_type(cls, v: str) -> str:
-        """Validate transport type."""
-        if v not in ["stdio", "sse", "http"]:
-            raise ValueError(f"Invalid transport type: {v}. Must be one of: stdio, sse, http")
-        return v
-
-    @field_validator("command")
-    @classmethod
-    def validate_command(cls, v: str) -> str:
-        """Validate command."""
-        return InputValidator.validate_command(v)
-
-    @field_validator("args")
-    @classmethod
-    def validate_args(cls, v: list[str]) -> list[str]:
-        """Validate command arguments."""
-        return InputValidator.validate_command_args(v)
-
-    @field_validator("env")
-    @classmethod
-    def validate_env(cls, v: dict[str, str]) -> dict[str, str]:
-        """Validate environment variables."""
-        return InputValidator.validate_env_vars(v)
+    @model_validator(mode="after")
+    def validate_fields(self) -> "InstanceConfig":
+        """Validate provider, name, type, command, args and env in a single pass."""
+        InputValidator.validate_provider_name(self.provider)
+        InputValidator.validate_instance_name(self.name)
+        if self.type not in _VALID_TRANSPORT_TYPES:
+            raise ValueError(
+                f"Invalid transport type: {self.type}. Must be one of: stdio, sse, http"
+            )
+        InputValidator.validate_command(self.command)
+        InputValidator.validate_command_args(self.args)
+        InputValidator.validate_env_vars(self.env)
+        return self
 
 
 class ToolCallRequest(BaseModel):
@@ -84,10 +82,9 @@ class ToolCallRequest(BaseModel):
         """Validate tool name."""
         if not v or len(v) > 200:
             raise ValueError("Tool name must be between 1 and 200 characters")
-        dangerous_chars = ["/", "\\", "..", ";", "|", "&", "$", "`"]
-        for char in dangerous_chars:
-            if char in v:
-                raise ValueError(f"Tool name contains dangerous character: {char}")
+        match = _TOOL_NAME_DANGEROUS.search(v)
+        if match:
+            raise ValueError(f"Tool name contains dangerous character: {match.group()}")
         return v
 
 
@@ -106,173 +103,264 @@ def validate_instance_name_param(name: str) -> str:
     try:
         return InputValidator.validate_instance_name(name)
     except ValidationError as e:
-        raise HTTPException(status_code=400, detail=str(e)) from e
+        raise HTTPException(status_code=400, detail=str(e)) from None
 
 
-def create_router(mcp_router: MCPRouter, security_manager: SecurityManager) -> APIRouter:
-    """Create API router with all endpoints.
+def _json_body(model: type[_ModelT]) -> Callable[[Request], Awaitable[_ModelT]]:
+    """Build a dependency that parses and validates a JSON body in one pydantic-core pass.
 
     Args:
-        mcp_router: MCP router instance
-        security_manager: Security manager instance
+        model: Pydantic model describing the request body
 
     Returns:
-        Configured APIRouter
+        Dependency returning the validated model
+
+    Raises:
+        RequestValidationError: If the body is not valid for the model (answered with 422)
     """
-    router = APIRouter()
 
-    async def verify_token(authorization: str | None = Header(None)) -> bool:
-        """Verify bearer token from authorization header.
+    async def parse(request: Request) -> _ModelT:
+        body = await request.body()
+        try:
+            return model.model_validate_json(body)
+        except PydanticValidationError as e:
+            errors = [
+                {**error, "loc": ("body", *error["loc"])}
+                for error in e.errors(include_url=False)
+            ]
+            raise RequestValidationError(errors, body=body) from None
 
-        Args:
-            authorization: Authorization header value
+    return parse
 
-        Returns:
-            True if valid
 
-        Raises:
-            HTTPException: If authentication fails
-        """
-        try:
-            security_manager.validate_bearer_token(authorization)
-            return True
-        except Exception as e:
-            raise HTTPException(status_code=401, detail=str(e)) from e
-
-    @router.get("/instances", dependencies=[Depends(verify_token)])
-    async def list_instances() -> list[dict[str, Any]]:
-        """List all MCP instances."""
-        try:
-            return mcp_router.list()
-        except MCPRouterException as e:
-            raise HTTPException(status_code=400, detail=e.to_dict()) from e
-        except Exception as e:
-            logger.error(f"Error listing instances: {e}")
-            raise HTTPException(status_code=500, detail=str(e)) from e
-
-    @router.get("/instances/{name}", dependencies=[Depends(verify_token)])
-    async def get_instance(name: str) -> dict[str, Any]:
-        """Get instance details."""
-        try:
-            validated_name = validate_instance_name_param(name)
-            instance = mcp_router.client_manager.get_instance(validated_name)
-            return instance.to_dict()
-        except MCPRouterException as e:
-            raise HTTPException(status_code=404, detail=e.to_dict()) from e
-        except Exception as e:
-            logger.error(f"Error getting instance: {e}")
-            raise HTTPException(status_code=500, detail=str(e)) from e
-
-    @router.get("/tools", dependencies=[Depends(verify_token)])
-    async def list_all_tools() -> dict[str, list[dict[str, Any]]]:
-        """List all tools from all instances."""
-        try:
-            return mcp_router.help()
-        except MCPRouterException as e:
-            raise HTTPException(status_code=400, detail=e.to_dict()) from e
-        except Exception as e:
-            logger.error(f"Error listing tools: {e}")
-            raise HTTPException(status_code=500, detail=str(e)) from e
-
-    @router.get("/tools/{instance_name}", dependencies=[Depends(verify_token)])
-    async def list_instance_tools(instance_name: str) -> list[dict[str, Any]]:
-        """Get tools for a specific instance."""
-        try:
-            validated_name = validate_instance_name_param(instance_name)
-            instance = mcp_router.client_manager.get_instance(validated_name)
-            tools = instance.get_tools()
-            return list(tools.values())
-        except MCPRouterException as e:
-            raise HTTPException(status_code=404, detail=e.to_dict()) from e
-        except Exception as e:
-            logger.error(f"Error getting instance tools: {e}")
-            raise HTTPException(status_code=500, detail=str(e)) from e
-
-    @router.post("/instances", dependencies=[Depends(verify_token)])
-    async def add_instance(config: InstanceConfig) -> dict[str, str]:
-        """Add a new MCP instance."""
-        try:
-            result = await mcp_router.add(config.provider, config.model_dump())
-            return result
-        except MCPRouterException as e:
-            raise HTTPException(status_code=400, detail=e.to_dict()) from e
-        except Exception as e:
-            logger.error(f"Error adding instance: {e}")
-            raise HTTPException(status_code=500, detail=str(e)) from e
-
-    @router.patch("/instances/{name}", dependencies=[Depends(verify_token)])
-    async def update_instance(name: str, config: InstanceConfig) -> dict[str, str]:
-        """Update an existing instance."""
-        try:
-            validated_name = validate_instance_name_param(name)
-            await mcp_router.remove(validated_name)
-            result = await mcp_router.add(config.provider, config.model_dump())
-            return result
-        except MCPRouterException as e:
-            raise HTTPException(status_code=400, detail=e.to_dict()) from e
-        except Exception as e:
-            logger.error(f"Error updating instance: {e}")
-            raise HTTPException(status_code=500, detail=str(e)) from e
-
-    @router.delete("/instances/{name}", dependencies=[Depends(verify_token)])
-    async def delete_instance(name: str) -> dict[str, str]:
-        """Delete an MCP instance."""
-        try:
-            validated_name = validate_instance_name_param(name)
-            result = await mcp_router.remove(validated_name)
-            return result
-        except MCPRouterException as e:
-            raise HTTPException(status_code=404, detail=e.to_dict()) from e
-        except Exception as e:
-            logger.error(f"Error deleting instance: {e}")
-            raise HTTPException(status_code=500, detail=str(e)) from e
-
-    @router.post("/instances/{name}/enable", dependencies=[Depends(verify_token)])
-    async def enable_instance(name: str) -> dict[str, Any]:
-        """Enable an MCP instance."""
-        try:
-            validated_name = validate_instance_name_param(name)
-            result = await mcp_router.enable(validated_name)
-            return result
-        except MCPRouterException as e:
-            raise HTTPException(status_code=404, detail=e.to_dict()) from e
-        except Exception as e:
-            logger.error(f"Error enabling instance: {e}")
-            raise HTTPException(status_code=500, detail=str(e)) from e
-
-    @router.post("/instances/{name}/disable", dependencies=[Depends(verify_token)])
-    async def disable_instance(name: str) -> dict[str, Any]:
-        """Disable an MCP instance."""
-        try:
-            validated_name = validate_instance_name_param(name)
-            result = await mcp_router.disable(validated_name)
-            return result
-        except MCPRouterException as e:
-            raise HTTPException(status_code=404, detail=e.to_dict()) from e
-        except Exception as e:
-            logger.error(f"Error disabling instance: {e}")
-            raise HTTPException(status_code=500, detail=str(e)) from e
-
-    @router.post("/call", dependencies=[Depends(verify_token)])
-    async def call_tool(request: ToolCallRequest) -> Any:
-        """Call a tool on a specific instance."""
-        try:
-            result = await mcp_router.call(request.instance, request.tool, **request.params)
-            return result
-        except MCPRouterException as e:
-            raise HTTPException(status_code=400, detail=e.to_dict()) from e
-        except Exception as e:
-            logger.error(f"Error calling tool: {e}")
-            raise HTTPException(status_code=500, detail=str(e)) from e
-
-    @router.get("/config", dependencies=[Depends(verify_token)])
-    async def get_config() -> dict[str, Any]:
-        """Get current configuration (for debugging)."""
-        try:
-            instances = mcp_router.list()
-            return {"instances": instances, "current_instance": mcp_router.get_current_instance()}
-        except Exception as e:
-            logger.error(f"Error getting config: {e}")
-            raise HTTPException(status_code=500, detail=str(e)) from e
+def _body_schema(model: type[BaseModel]) -> dict[str, Any]:
+    """Describe a body parsed by ``_json_body`` in the OpenAPI schema.
+
+    Args:
+        model: Pydantic model describing the request body
+
+    Returns:
+        Value for the route's ``openapi_extra``
+    """
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
+
+
+def _conditional_listing(request: Request, response: Response, version: int) -> Response | None:
+    """Attach validators for a listing and short-circuit unchanged re-fetches.
+
+    Args:
+        request: Incoming request
+        response: Response whose headers FastAPI will use for the body
+        version: Current version of the listed data
+
+    Returns:
+        A 304 response if the client's copy is current, otherwise None
+    """
+    etag = f'W/"{version:x}"'
+    headers = {"ETag": etag, "Cache-Control": _LISTING_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+async def get_mcp_router(request: Request) -> MCPRouter:
+    """Return the MCP router attached to the application.
+
+    Declared async so FastAPI calls it inline instead of through the thread pool.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        MCP router instance stored on ``app.state``
+    """
+    return request.app.state.mcp_router
+
+
+RouterDep = Annotated[MCPRouter, Depends(get_mcp_router)]
+InstanceBody = Annotated[InstanceConfig, Depends(_json_body(InstanceConfig))]
+ToolCallBody = Annotated[ToolCallRequest, Depends(_json_body(ToolCallRequest))]
+
+
+async def verify_token(request: Request, authorization: str | None = Header(None)) -> bool:
+    """Verify bearer token from authorization header.
+
+    Args:
+        request: Incoming request
+        authorization: Authorization header value
+
+    Returns:
+        True if valid
+
+    Raises:
+        HTTPException: If authentication fails
+    """
+    security_manager: SecurityManager = request.app.state.security_manager
+    if not security_manager.auth_required:
+        return True
+
+    if not authorization:
+        raise HTTPException(status_code=401, detail="Bearer token required but not provided")
+
+    # Strip the scheme once here; a bare token is still accepted as before
+    if authorization.startswith(_BEARER_PREFIX):
+        authorization = authorization[len(_BEARER_PREFIX) :]
+
+    try:
+        return security_manager.validate_token_value(authorization.strip())
+    except SecurityError as e:
+        raise HTTPException(status_code=401, detail=str(e)) from None
+
+
+class _ErrorLoggingRoute(APIRoute):
+    """Route that turns unexpected handler errors into a logged 500 response.
+
+    Handlers only translate the errors they expect; everything else ends up here, inside
+    the middleware stack so CORS and security headers still apply to the response.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Awaitable[Response]]:
+        """Wrap FastAPI's route handler with the catch-all error handling."""
+        route_handler = super().get_route_handler()
+
+        async def handle(request: Request) -> Response:
+            try:
+                return await route_handler(request)
+            except (StarletteHTTPException, RequestValidationError):
+                raise
+            except Exception as e:
+                logger.error(f"Error handling {request.method} {request.url.path}: {e}")
+                return JSONResponse({"detail": str(e)}, status_code=500)
+
+        return handle
+
+
+# Built once at import; every endpoint requires a valid token. create_app() stores the
+# MCP router and security manager on app.state for the dependencies above.
+router = APIRouter(dependencies=[Depends(verify_token)], route_class=_ErrorLoggingRoute)
+
+
+@router.get("/instances")
+async def list_instances(request: Request, response: Response, mcp_router: RouterDep) -> Any:
+    """List all MCP instances."""
+    try:
+        not_modified = _conditional_listing(request, response, mcp_router.client_manager.version)
+        if not_modified is not None:
+            return not_modified
+        return mcp_router.list()
+    except MCPRouterException as e:
+        raise HTTPException(status_code=400, detail=e.to_dict()) from None
+
+
+@router.get("/instances/{name}")
+async def get_instance(name: str, mcp_router: RouterDep) -> dict[str, Any]:
+    """Get instance details."""
+    try:
+        validated_name = validate_instance_name_param(name)
+        instance = mcp_router.client_manager.get_instance(validated_name)
+        return instance.to_dict()
+    except MCPRouterException as e:
+        raise HTTPException(status_code=404, detail=e.to_dict()) from None
+
+
+@router.get("/tools")
+async def list_all_tools(request: Request, response: Response, mcp_router: RouterDep) -> Any:
+    """List all tools from all instances."""
+    try:
+        not_modified = _conditional_listing(request, response, mcp_router.client_manager.version)
+        if not_modified is not None:
+            return not_modified
+        return mcp_router.help()
+    except MCPRouterException as e:
+        raise HTTPException(status_code=400, detail=e.to_dict()) from None
+
+
+@router.get("/tools/{instance_name}")
+async def list_instance_tools(instance_name: str, mcp_router: RouterDep) -> list[dict[str, Any]]:
+    """Get tools for a specific instance."""
+    try:
+        validated_name = validate_instance_name_param(instance_name)
+        instance = mcp_router.client_manager.get_instance(validated_name)
+        tools = instance.get_tools()
+        return list(tools.values())
+    except MCPRouterException as e:
+        raise HTTPException(status_code=404, detail=e.to_dict()) from None
+
+
+@router.post("/instances", openapi_extra=_body_schema(InstanceConfig))
+async def add_instance(config: InstanceBody, mcp_router: RouterDep) -> dict[str, str]:
+    """Add a new MCP instance."""
+    try:
+        result = await mcp_router.add(config.provider, config.model_dump())
+        return result
+    except MCPRouterException as e:
+        raise HTTPException(status_code=400, detail=e.to_dict()) from None
+
+
+@router.patch("/instances/{name}", openapi_extra=_body_schema(InstanceConfig))
+async def update_instance(name: str, config: InstanceBody, mcp_router: RouterDep) -> dict[str, str]:
+    """Update an existing instance."""
+    try:
+        validated_name = validate_instance_name_param(name)
+        payload = config.model_dump()
+        await mcp_router.remove(validated_name)
+        result = await mcp_router.add(config.provider, payload)
+        return result
+    except MCPRouterException as e:
+        raise HTTPException(status_code=400, detail=e.to_dict()) from None
+
+
+@router.delete("/instances/{name}")
+async def delete_instance(name: str, mcp_router: RouterDep) -> dict[str, str]:
+    """Delete an MCP instance."""
+    try:
+        validated_name = validate_instance_name_param(name)
+        result = await mcp_router.remove(validated_name)
+        return result
+    except MCPRouterException as e:
+        raise HTTPException(status_code=404, detail=e.to_dict()) from None
+
+
+@router.post("/instances/{name}/enable")
+async def enable_instance(name: str, mcp_router: RouterDep) -> dict[str, Any]:
+    """Enable an MCP instance."""
+    try:
+        validated_name = validate_instance_name_param(name)
+        result = await mcp_router.enable(validated_name)
+        return result
+    except MCPRouterException as e:
+        raise HTTPException(status_code=404, detail=e.to_dict()) from None
+
+
+@router.post("/instances/{name}/disable")
+async def disable_instance(name: str, mcp_router: RouterDep) -> dict[str, Any]:
+    """Disable an MCP instance."""
+    try:
+        validated_name = validate_instance_name_param(name)
+        result = await mcp_router.disable(validated_name)
+        return result
+    except MCPRouterException as e:
+        raise HTTPException(status_code=404, detail=e.to_dict()) from None
+
+
+@router.post("/call", openapi_extra=_body_schema(ToolCallRequest))
+async def call_tool(request: ToolCallBody, mcp_router: RouterDep) -> Any:
+    """Call a tool on a specific instance."""
+    try:
+        result = await mcp_router.call(request.instance, request.tool, **request.params)
+        return result
+    except MCPRouterException as e:
+        raise HTTPException(status_code=400, detail=e.to_dict()) from None
+
 
-    return router
+@router.get("/config")
+async def get_config(mcp_router: RouterDep) -> dict[str, Any]:
+    """Get current configuration (for debugging)."""
+    instances = mcp_router.list()
+    return {"instances": instances, "current_instance": mcp_router.get_current_instance()}
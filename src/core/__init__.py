@@ -1,15 +1,32 @@
 """Core modules for MCP Router."""
 
-from .config import ConfigManager
-from .exceptions import (
-    ConfigurationError,
-    InstanceNotFoundError,
-    MCPRouterException,
-    TimeoutError,
-    ToolNotFoundError,
-    ValidationError,
-)
-from .logger import get_logger, setup_logging
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import ConfigManager
+    from .exceptions import (
+        ConfigurationError,
+        InstanceNotFoundError,
+        MCPRouterException,
+        TimeoutError,
+        ToolNotFoundError,
+        ValidationError,
+    )
+    from .logger import get_logger, setup_logging
+
+# Public name -> submodule that defines it, imported on first access
+_LAZY_ATTRS = {
+    "get_logger": ".logger",
+    "setup_logging": ".logger",
+    "ConfigManager": ".config",
+    "MCPRouterException": ".exceptions",
+    "ConfigurationError": ".exceptions",
+    "ValidationError": ".exceptions",
+    "InstanceNotFoundError": ".exceptions",
+    "ToolNotFoundError": ".exceptions",
+    "TimeoutError": ".exceptions",
+}
 
 __all__ = [
     "get_logger",
@@ -22,3 +39,18 @@ __all__ = [
     "ToolNotFoundError",
     "TimeoutError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import re-exported names on first access (PEP 562).
+
+    Importing any ``src.core`` submodule runs this package first; deferring the
+    re-exports keeps that from pulling in the config and logging modules too.
+    """
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,18 +1,68 @@
 """Configuration manager for MCP Router."""
 
-import json
 from pathlib import Path
 from typing import Any
 
+from . import jsonio
 from .exceptions import ConfigurationError
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Template for a fresh config.json; every section is a flat dict of scalars
+_DEFAULT_CONFIG: dict[str, dict[str, Any]] = {
+    "api": {
+        "enabled": False,
+        "port": 8000,
+        "host": "127.0.0.1",
+        "cors_origin": "*",
+        "auto_find_port": True,
+        "enable_realtime_logs": False,
+    },
+    "server": {
+        "enabled": True,
+        "transport_type": "stdio",
+        "allow_instance_management": False,
+    },
+    "mcp_client": {"enabled": True, "timeout": 30, "idle_timeout": 0},
+    "security": {"bearer_token": "", "enable_validation": True},
+    "logging": {
+        "level": "INFO",
+        "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        "directory": "logs",
+    },
+    "watcher": {"enabled": True, "watch_path": "data", "debounce_delay": 1.0},
+}
+
+
+def _flatten(config: dict[str, Any]) -> dict[str, Any]:
+    """Index a nested configuration by dotted key, intermediate dicts included.
+
+    Args:
+        config: Nested configuration dictionary
+
+    Returns:
+        Mapping of dotted keys (e.g. 'api.port') to values
+    """
+    flat: dict[str, Any] = {}
+    stack: list[tuple[str, Any]] = [("", config)]
+    while stack:
+        prefix, node = stack.pop()
+        if not isinstance(node, dict):
+            continue
+        for k, v in node.items():
+            dotted = f"{prefix}{k}"
+            flat[dotted] = v
+            stack.append((f"{dotted}.", v))
+    return flat
+
 
 class ConfigManager:
     """Manages global configuration for MCP Router."""
 
+    # Every dotted key present in the default configuration
+    KNOWN_KEYS: frozenset[str] = frozenset(_flatten(_DEFAULT_CONFIG))
+
     def __init__(self, config_path: str = "config.json"):
         """Initialize configuration manager.
 
@@ -21,6 +71,8 @@ class ConfigManager:
         """
         self.config_path = Path(config_path)
         self._config: dict[str, Any] = {}
+        # Flat dotted-key index (intermediate dicts included) so get() is one lookup
+        self._flat: dict[str, Any] = {}
         self.load()
 
     def load(self) -> None:
@@ -28,6 +80,7 @@ class ConfigManager:
         if not self.config_path.exists():
             logger.warning(f"Config file not found: {self.config_path}, using defaults")
             self._config = self._get_default_config()
+            self._reindex()
             self.save()
             return
 
@@ -39,16 +92,20 @@ class ConfigManager:
                     f"Config file too large ({file_size} bytes). Maximum allowed: {max_size} bytes"
                 )
 
-            with open(self.config_path, encoding="utf-8") as f:
-                content = f.read().strip()
-                if not content:
-                    logger.warning("Config file is empty, using defaults")
-                    self._config = self._get_default_config()
-                    self.save()
-                    return
-                self._config = json.loads(content)
+            try:
+                self._config = jsonio.load_file(self.config_path)
+            except jsonio.JSONDecodeError:
+                # Only a blank file falls back to defaults; checked on the error path only
+                if file_size and self.config_path.read_bytes().strip():
+                    raise
+                logger.warning("Config file is empty, using defaults")
+                self._config = self._get_default_config()
+                self._reindex()
+                self.save()
+                return
+            self._reindex()
             logger.info(f"Configuration loaded from {self.config_path}")
-        except json.JSONDecodeError as e:
+        except jsonio.JSONDecodeError as e:
             raise ConfigurationError(f"Invalid JSON in config file: {e}") from e
         except Exception as e:
             raise ConfigurationError(f"Failed to load config: {e}") from e
@@ -57,8 +114,7 @@ class ConfigManager:
         """Save configuration to file."""
         try:
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(self._config, f, indent=2, ensure_ascii=False)
+            jsonio.dump_file(self.config_path, self._config, indent=True)
             logger.info(f"Configuration saved to {self.config_path}")
         except Exception as e:
             raise ConfigurationError(f"Failed to save config: {e}") from e
@@ -73,16 +129,7 @@ class ConfigManager:
         Returns:
             Configuration value
         """
-        keys = key.split(".")
-        value = self._config
-
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-
-        return value
+        return self._flat.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
         """Set configuration value.
@@ -100,6 +147,18 @@ class ConfigManager:
             config = config[k]
 
         config[keys[-1]] = value
+        self._reindex()
+
+    def has_default(self, key: str) -> bool:
+        """Check whether a key is part of the default configuration.
+
+        Args:
+            key: Configuration key (supports dot notation)
+
+        Returns:
+            True if the default configuration defines the key
+        """
+        return key in self.KNOWN_KEYS
 
     def get_all(self) -> dict[str, Any]:
         """Get all configuration.
@@ -109,6 +168,10 @@ class ConfigManager:
         """
         return self._config.copy()
 
+    def _reindex(self) -> None:
+        """Rebuild the dotted-key index after the configuration changes."""
+        self._flat = _flatten(self._config)
+
     @staticmethod
     def _get_default_config() -> dict[str, Any]:
         """Get default configuration.
@@ -116,26 +179,4 @@ class ConfigManager:
         Returns:
             Default configuration dictionary
         """
-        return {
-            "api": {
-                "enabled": False,
-                "port": 8000,
-                "host": "127.0.0.1",
-                "cors_origin": "*",
-                "auto_find_port": True,
-                "enable_realtime_logs": False,
-            },
-            "server": {
-                "enabled": True,
-                "transport_type": "stdio",
-                "allow_instance_management": False,
-            },
-            "mcp_client": {"enabled": True, "timeout": 30},
-            "security": {"bearer_token": "", "enable_validation": True},
-            "logging": {
-                "level": "INFO",
-                "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-                "directory": "logs",
-            },
-            "watcher": {"enabled": True, "watch_path": "data", "debounce_delay": 1.0},
-        }
+        return {section: dict(values) for section, values in _DEFAULT_CONFIG.items()}
@@ -0,0 +1,155 @@
+"""JSON helpers that use orjson when it is installed."""
+
+import json
+import mmap
+import os
+import tempfile
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+JSONDecodeError = json.JSONDecodeError
+
+# Files larger than this are memory-mapped and parsed in place by orjson
+MMAP_THRESHOLD = 64 * 1024
+
+# Process umask, applied to new files since mkstemp always creates them as 0600
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: JSON text or UTF-8 encoded bytes
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        JSONDecodeError: If the document is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_file(path: str | os.PathLike) -> Any:
+    """Parse a JSON file.
+
+    With orjson, files above ``MMAP_THRESHOLD`` are memory-mapped and parsed
+    straight from the mapping instead of being copied into a bytes object first.
+
+    Args:
+        path: JSON file path
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        OSError: If the file cannot be read
+        JSONDecodeError: If the document is not valid JSON
+    """
+    with open(path, "rb") as f:
+        if ORJSON_AVAILABLE and os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+            with (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+                memoryview(mapped) as view,
+            ):
+                return orjson.loads(view)
+        return loads(f.read())
+
+
+def dumps(
+    obj: Any,
+    *,
+    indent: bool = False,
+    default: Callable[[Any], Any] | None = None,
+    sort_keys: bool = False,
+) -> str:
+    """Serialize an object to JSON text, keeping non-ASCII characters as-is.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with a two-space indent
+        default: Called for objects that are not natively serializable
+        sort_keys: Emit dictionary keys in sorted order
+
+    Returns:
+        JSON text
+    """
+    if ORJSON_AVAILABLE:
+        return _dumps_orjson(obj, indent, default, sort_keys).decode()
+
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2, default=default, sort_keys=sort_keys)
+    return json.dumps(
+        obj, ensure_ascii=False, separators=(",", ":"), default=default, sort_keys=sort_keys
+    )
+
+
+def dump_file(path: str | os.PathLike, obj: Any, *, indent: bool = False) -> None:
+    """Atomically write an object to a JSON file.
+
+    The document is written and fsynced to a uniquely named sibling temporary
+    file, which then replaces the target, so readers never observe a partially
+    written file and concurrent writers never share a temporary file.
+
+    Args:
+        path: Destination file path
+        obj: Object to serialize
+        indent: Pretty-print with a two-space indent
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    if ORJSON_AVAILABLE:
+        data = _dumps_orjson(obj, indent)
+    else:
+        data = dumps(obj, indent=indent).encode("utf-8")
+
+    path = os.fspath(path)
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except OSError:
+        mode = 0o666 & ~_UMASK
+
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path) or ".", prefix=f".{os.path.basename(path)}.", suffix=".tmp"
+    )
+    try:
+        with open(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _dumps_orjson(
+    obj: Any,
+    indent: bool,
+    default: Callable[[Any], Any] | None = None,
+    sort_keys: bool = False,
+) -> bytes:
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    return orjson.dumps(obj, default=default, option=option)
@@ -1,15 +1,26 @@
 """Logging system for MCP Router."""
 
 import logging
-import shutil
+import re
+import time
 from datetime import datetime
 from pathlib import Path
 
-_loggers = {}
+# 已知的harmless错误模式（MCP子进程的非JSON输出引起）
+_HARMLESS_PATTERNS = (
+    "Failed to parse JSONRPC message from server",
+    "Invalid JSON: expected value",
+    "Apifox MCP Server",
+    "请阅读帮助文档",
+)
+# 编译为一个正则，一次扫描即可匹配全部模式
+_NOISE_PATTERN = re.compile("|".join(re.escape(p) for p in _HARMLESS_PATTERNS))
+# 产生这些噪音的logger
+_STDIO_LOGGER_NAME = "mcp.client.stdio"
 
 
 class StdioNoiseFilter(logging.Filter):
-    """过滤MCP客户端stdio通信中的已知噪音错误"""
+    """过滤MCP客户端stdio通信中的已知噪音错误（安装在 mcp.client.stdio logger 上）"""
 
     def filter(self, record: logging.LogRecord) -> bool:
         """Filter out known harmless errors from MCP stdio communication.
@@ -21,20 +32,125 @@ class StdioNoiseFilter(logging.Filter):
             False if record should be filtered out, True otherwise
         """
         # 完全过滤掉MCP客户端的JSON解析错误（由子进程的非JSON输出引起）
-        if record.name == "mcp.client.stdio":
-            msg = record.getMessage()
-            # 已知的harmless错误模式
-            harmless_patterns = [
-                "Failed to parse JSONRPC message from server",
-                "Invalid JSON: expected value",
-                "Apifox MCP Server",
-                "请阅读帮助文档",
-            ]
-            # 完全过滤掉包含这些模式的消息
-            if any(pattern in msg for pattern in harmless_patterns):
+        # 模式通常出现在格式字符串中，先检查原始 msg，避免 % 格式化
+        msg = record.msg
+        if isinstance(msg, str):
+            if _NOISE_PATTERN.search(msg):
                 return False
+            if not record.args:
+                return True
 
-        return True
+        return not _NOISE_PATTERN.search(record.getMessage())
+
+
+_noise_filter = StdioNoiseFilter()
+
+
+class _SharedFormatter(logging.Formatter):
+    """Formatter shared by several handlers that formats each record only once.
+
+    Every handler on the root logger formats the same record in turn; the last
+    result is kept and reused while the same record object is being handled.
+    """
+
+    def __init__(self, fmt: str | None = None, datefmt: str | None = None):
+        """Initialize formatter.
+
+        Args:
+            fmt: Log message format
+            datefmt: Date format for ``%(asctime)s``
+        """
+        super().__init__(fmt, datefmt)
+        # (record, text) swapped as one tuple so concurrent threads never mix pairs
+        self._last: tuple[logging.LogRecord | None, str] = (None, "")
+        # (whole second, formatted date) for consecutive records in the same second
+        self._last_time: tuple[int, str] = (-1, "")
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record, reusing the previous result for the same record.
+
+        Args:
+            record: Log record to format
+
+        Returns:
+            Formatted log line
+        """
+        last_record, text = self._last
+        if last_record is record:
+            return text
+        text = super().format(record)
+        self._last = (record, text)
+        return text
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        """Format the record time, reusing the date string within the same second.
+
+        ``time.strftime`` has no sub-second fields, so the date part only changes
+        once per second; milliseconds are appended as ``logging.Formatter`` does.
+
+        Args:
+            record: Log record
+            datefmt: Date format, or None for the default format
+
+        Returns:
+            Formatted time
+        """
+        second = int(record.created)
+        cached_second, date = self._last_time
+        if cached_second != second:
+            ct = self.converter(record.created)
+            date = time.strftime(datefmt or self.default_time_format, ct)
+            self._last_time = (second, date)
+        if datefmt:
+            return date
+        return self.default_msec_format % (date, record.msecs)
+
+
+class _TeeFileHandler(logging.Handler):
+    """Handler writing each formatted record to several log files.
+
+    One handler for ``latest-{mode}.txt`` and the timestamped log means one level
+    check, one lock and one ``format()`` per record instead of one per file.
+    """
+
+    terminator = "\n"
+
+    def __init__(self, paths: list[Path], encoding: str = "utf-8"):
+        """Open every log file for writing.
+
+        Args:
+            paths: Log files that receive every record
+            encoding: Text encoding of the log files
+        """
+        super().__init__()
+        self.streams = [open(path, "w", encoding=encoding) for path in paths]
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a formatted record to every log file.
+
+        Args:
+            record: Log record
+        """
+        try:
+            line = self.format(record) + self.terminator
+            for stream in self.streams:
+                stream.write(line)
+                stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        """Close every log file."""
+        self.acquire()
+        try:
+            for stream in self.streams:
+                stream.close()
+            self.streams = []
+        finally:
+            self.release()
+        super().close()
 
 
 def setup_logging(
@@ -64,16 +180,16 @@ def setup_logging(
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
 
-    formatter = logging.Formatter(log_format)
+    formatter = _SharedFormatter(log_format)
 
-    # 创建噪音过滤器
-    noise_filter = StdioNoiseFilter()
+    # 噪音过滤器只装在产生噪音的logger上，每条记录只检查一次；
+    # 复用同一实例，重复调用 setup_logging 时 addFilter 不会重复添加
+    logging.getLogger(_STDIO_LOGGER_NAME).addFilter(_noise_filter)
 
     # 控制台输出
     console_handler = logging.StreamHandler()
     console_handler.setLevel(numeric_level)
     console_handler.setFormatter(formatter)
-    console_handler.addFilter(noise_filter)  # 添加过滤器到处理器
     root_logger.addHandler(console_handler)
 
     # Minecraft风格的日志文件
@@ -84,23 +200,25 @@ def setup_logging(
     latest_log = log_dir / f"latest-{transport_mode}.txt"
 
     # 如果latest-{mode}.txt存在，备份为时间戳文件（带传输模式）
-    if latest_log.exists():
-        # 获取文件的修改时间
+    try:
+        # 获取文件的修改时间（文件不存在时跳过备份）
         mtime = latest_log.stat().st_mtime
-        timestamp = datetime.fromtimestamp(mtime)
+    except FileNotFoundError:
+        mtime = None
+
+    if mtime is not None:
         # 格式：YY.MM.DD-HH-MM-{mode}.txt
-        backup_name = timestamp.strftime(f"%y.%m.%d-%H-%M-{transport_mode}.txt")
-        backup_path = log_dir / backup_name
+        backup_base = f"{datetime.fromtimestamp(mtime).strftime('%y.%m.%d-%H-%M')}-{transport_mode}"
+        backup_path = log_dir / f"{backup_base}.txt"
 
         # 如果同名备份已存在，添加序号
         counter = 1
         while backup_path.exists():
-            backup_name = timestamp.strftime(f"%y.%m.%d-%H-%M-{transport_mode}-{counter}.txt")
-            backup_path = log_dir / backup_name
+            backup_path = log_dir / f"{backup_base}-{counter}.txt"
             counter += 1
 
-        # 移动旧日志
-        shutil.move(str(latest_log), str(backup_path))
+        # 同一目录内重命名旧日志
+        latest_log.rename(backup_path)
 
     # 生成新的日志文件名（带传输模式）
     now = datetime.now()
@@ -113,19 +231,12 @@ def setup_logging(
         timestamped_log = log_dir / f"{timestamp}-{transport_mode}-{counter}.txt"
         counter += 1
 
-    # 创建文件处理器 - latest.txt和时间戳日志
-    file_handler = logging.FileHandler(latest_log, mode="w", encoding="utf-8")
+    # 创建文件处理器 - latest.txt和时间戳日志由同一个处理器写入
+    file_handler = _TeeFileHandler([latest_log, timestamped_log])
     file_handler.setLevel(numeric_level)
     file_handler.setFormatter(formatter)
-    file_handler.addFilter(noise_filter)  # 添加过滤器到文件处理器
     root_logger.addHandler(file_handler)
 
-    timestamped_handler = logging.FileHandler(timestamped_log, mode="w", encoding="utf-8")
-    timestamped_handler.setLevel(numeric_level)
-    timestamped_handler.setFormatter(formatter)
-    timestamped_handler.addFilter(noise_filter)
-    root_logger.addHandler(timestamped_handler)
-
 
 def get_logger(name: str) -> logging.Logger:
     """Get a logger with the specified name.
@@ -136,6 +247,4 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Logger instance
     """
-    if name not in _loggers:
-        _loggers[name] = logging.getLogger(name)
-    return _loggers[name]
+    return logging.getLogger(name)
@@ -1,12 +1,17 @@
 """MCP client management."""
 
 import asyncio
-import json
+import hashlib
+import time
+from collections.abc import Callable, Mapping
+from contextlib import AsyncExitStack
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 from mcp import ClientSession
 
+from ..core import jsonio
 from ..core.exceptions import (
     ConfigurationError,
     InstanceNotFoundError,
@@ -23,9 +28,55 @@ from .transport import create_transport
 MAX_CONFIG_FILE_SIZE = 5 * 1024 * 1024  # 5MB
 MAX_METADATA_ENTRIES = 50
 MAX_ENV_VARS = 100
+MAX_CONCURRENT_LOADS = 8  # 启动时同时连接的实例数上限
+IDLE_CHECK_INTERVAL = 30.0  # 空闲实例检查间隔（秒）
+DISCONNECT_TIMEOUT = 2.0  # 断开 session/transport 的单步超时（秒）
 
 logger = get_logger(__name__)
 
+# 内容相同的工具 inputSchema 在所有实例间共享同一个 dict（键为规范化 JSON 的摘要）；
+# 值为 [schema, 引用计数]，最后一个使用它的工具释放后移除
+_SCHEMA_INTERN: dict[bytes, list[Any]] = {}
+
+
+def _intern_schema(schema: Any) -> tuple[bytes | None, Any]:
+    """Return the shared copy of a tool input schema with the same content.
+
+    Interned schemas are shared between tools and instances and must not be modified.
+    Each successful call takes a reference that must be dropped with ``_release_schema``.
+
+    Args:
+        schema: JSON schema as returned by the server
+
+    Returns:
+        (intern key, canonical schema equal to ``schema``); the key is None when the
+        schema cannot be serialized and is therefore not interned
+    """
+    try:
+        canonical = jsonio.dumps(schema, sort_keys=True)
+    except (TypeError, ValueError):
+        return None, schema
+    key = hashlib.blake2b(canonical.encode(), digest_size=16).digest()
+
+    entry = _SCHEMA_INTERN.get(key)
+    if entry is None:
+        _SCHEMA_INTERN[key] = [schema, 1]
+        return key, schema
+    entry[1] += 1
+    return key, entry[0]
+
+
+def _release_schema(key: bytes) -> None:
+    """Drop a reference taken by ``_intern_schema``.
+
+    Args:
+        key: Intern key returned by ``_intern_schema``
+    """
+    entry = _SCHEMA_INTERN[key]
+    entry[1] -= 1
+    if entry[1] == 0:
+        del _SCHEMA_INTERN[key]
+
 
 class MCPClientInstance:
     """Represents a single MCP client instance."""
@@ -41,6 +92,7 @@ class MCPClientInstance:
         is_active: bool = True,
         metadata: dict[str, Any] | None = None,
         timeout: float = 30.0,
+        on_change: Callable[[], None] | None = None,
     ):
         """Initialize MCP client instance.
 
@@ -54,6 +106,7 @@ class MCPClientInstance:
             is_active: Whether instance is active
             metadata: Additional metadata
             timeout: Operation timeout in seconds
+            on_change: Called after the instance connects or disconnects
         """
         self.name = name
         self.provider = provider
@@ -64,20 +117,35 @@ class MCPClientInstance:
         self.is_active = is_active
         self.metadata = metadata or {}
         self.timeout = timeout
+        self._on_change = on_change
 
         self._session: ClientSession | None = None
         self._read_stream: Any = None
         self._write_stream: Any = None
         self._transport: Any = None
+        self._exit_stack = AsyncExitStack()
         self._tools: dict[str, Any] = {}
+        # 只读视图，get_tools 直接返回它；_tools 只原地修改，视图始终有效
+        self._tools_view = MappingProxyType(self._tools)
+        # 工具名到其 inputSchema 驻留键的映射，清除工具时据此释放引用
+        self._schema_keys: dict[str, bytes] = {}
         self._connected = False
 
+        # 空闲回收状态：最近一次使用时间、进行中的调用数、是否因空闲而断开
+        self._last_used = time.monotonic()
+        self._active_calls = 0
+        self._idle_closed = False
+        self._idle_lock = asyncio.Lock()
+
     async def connect(self) -> None:
         """Connect to MCP server."""
         if self._connected:
             logger.warning(f"Instance '{self.name}' already connected")
             return
 
+        # 每进入一个上下文就登记其退出回调，任何一步失败都能释放已打开的部分
+        stack = AsyncExitStack()
+        succeeded = False
         try:
             logger.info(f"Connecting to instance '{self.name}'...")
 
@@ -88,15 +156,23 @@ class MCPClientInstance:
             self._read_stream, self._write_stream = await asyncio.wait_for(
                 self._transport.__aenter__(), timeout=self.timeout
             )
+            stack.push_async_callback(self._exit_context, "Transport", self._transport)
 
             self._session = ClientSession(self._read_stream, self._write_stream)
             await asyncio.wait_for(self._session.__aenter__(), timeout=self.timeout)
+            stack.push_async_callback(self._exit_context, "Session", self._session)
 
             await self._session.initialize()
 
             await self._fetch_tools()
 
+            self._exit_stack = stack
             self._connected = True
+            succeeded = True
+            self._idle_closed = False
+            self._last_used = time.monotonic()
+            if self._on_change:
+                self._on_change()
             logger.info(
                 f"Instance '{self.name}' connected successfully with {len(self._tools)} tools"
             )
@@ -105,65 +181,90 @@ class MCPClientInstance:
         except Exception as e:
             logger.error(f"Failed to connect to instance '{self.name}': {e}")
             raise ConfigurationError(f"Failed to connect: {e}") from e
+        finally:
+            # 失败或被取消（CancelledError 不是 Exception）时释放已打开的部分
+            if not succeeded:
+                await self._release(stack)
+
+    async def ensure_connected(self) -> None:
+        """Connect unless already connected.
+
+        Serialized with idle disconnects and other reconnects, so concurrent
+        callers never open a second transport or race a disconnect in progress.
+        """
+        async with self._idle_lock:
+            if self._connected:
+                return
+            if self._idle_closed:
+                logger.info(f"Reconnecting idle instance '{self.name}'")
+            await self.connect()
 
     async def disconnect(self) -> None:
         """Disconnect from MCP server."""
         if not self._connected:
+            if self._idle_closed:
+                # 空闲断开时保留的工具列表，在真正断开时清除
+                self._idle_closed = False
+                self._clear_tools()
+                if self._on_change:
+                    self._on_change()
             return
 
         # 先标记为未连接，避免重复断开
         self._connected = False
 
-        # 使用超时机制强制断开，避免进程卡住
-        disconnect_timeout = 2.0  # 2秒超时
+        await self._release(self._exit_stack)
+        if self._on_change:
+            self._on_change()
+        logger.info(f"Instance '{self.name}' disconnected")
 
-        # 断开 session
-        if self._session:
-            try:
-                await asyncio.wait_for(
-                    self._session.__aexit__(None, None, None), timeout=disconnect_timeout
-                )
-            except asyncio.TimeoutError:
-                logger.debug(f"Session exit timeout for '{self.name}', forcing disconnect")
-            except (ConnectionError, BrokenPipeError, OSError) as e:
-                logger.debug(f"Session exit error (expected): {e}")
-            except RuntimeError as e:
-                # 捕获 "cancel scope in different task" 错误（这是预期的，不影响功能）
-                error_msg = str(e).lower()
-                if "cancel scope" in error_msg and "different task" in error_msg:
-                    logger.debug(f"Session exit cancel scope error (expected): {e}")
-                else:
-                    logger.warning(f"Session exit error: {e}")
-            except Exception as e:
-                logger.warning(f"Unexpected session exit error: {e}")
+    async def _release(self, stack: AsyncExitStack) -> None:
+        """Exit the contexts entered by connect and drop the references to them.
 
-        # 断开 transport
-        if self._transport:
-            try:
-                await asyncio.wait_for(
-                    self._transport.__aexit__(None, None, None), timeout=disconnect_timeout
-                )
-            except asyncio.TimeoutError:
-                logger.debug(f"Transport exit timeout for '{self.name}', forcing disconnect")
-            except (ConnectionError, BrokenPipeError, OSError) as e:
-                logger.debug(f"Transport exit error (expected): {e}")
-            except RuntimeError as e:
-                # 捕获 "cancel scope in different task" 错误（这是预期的，不影响功能）
-                error_msg = str(e).lower()
-                if "cancel scope" in error_msg and "different task" in error_msg:
-                    logger.debug(f"Transport exit cancel scope error (expected): {e}")
-                else:
-                    logger.warning(f"Transport exit error: {e}")
-            except Exception as e:
-                logger.warning(f"Unexpected transport exit error: {e}")
+        Args:
+            stack: Exit stack holding the session and transport exits
+        """
+        # 记下属于该 stack 的连接对象；退出期间可能已建立新的连接
+        session, transport = self._session, self._transport
 
-        # 清理资源
-        self._tools = {}
+        # session 先于 transport 退出（后进先出）
+        await stack.aclose()
+
+        if self._session is not session or self._transport is not transport:
+            # 新连接的状态不属于该 stack，保持不动
+            return
+
+        # 清理资源；空闲断开时保留工具列表，使其仍可被发现并在调用时重连
+        if not self._idle_closed:
+            self._clear_tools()
         self._session = None
         self._transport = None
         self._read_stream = None
         self._write_stream = None
-        logger.info(f"Instance '{self.name}' disconnected")
+
+    async def _exit_context(self, label: str, context: Any) -> None:
+        """Exit a session or transport context, logging instead of raising on failure.
+
+        Args:
+            label: "Session" or "Transport", used in log messages
+            context: Async context manager to exit
+        """
+        # 使用超时机制强制断开，避免进程卡住
+        try:
+            await asyncio.wait_for(context.__aexit__(None, None, None), timeout=DISCONNECT_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.debug(f"{label} exit timeout for '{self.name}', forcing disconnect")
+        except (ConnectionError, BrokenPipeError, OSError) as e:
+            logger.debug(f"{label} exit error (expected): {e}")
+        except RuntimeError as e:
+            # 捕获 "cancel scope in different task" 错误（这是预期的，不影响功能）
+            error_msg = str(e).lower()
+            if "cancel scope" in error_msg and "different task" in error_msg:
+                logger.debug(f"{label} exit cancel scope error (expected): {e}")
+            else:
+                logger.warning(f"{label} exit error: {e}")
+        except Exception as e:
+            logger.warning(f"Unexpected {label.lower()} exit error: {e}")
 
     async def _fetch_tools(self) -> None:
         """Fetch available tools from MCP server."""
@@ -173,14 +274,32 @@ class MCPClientInstance:
         try:
             result = await asyncio.wait_for(self._session.list_tools(), timeout=self.timeout)
 
-            self._tools = {}
+            # 重新获取（如空闲后重连）时，未变化的 schema 沿用已驻留的副本，无需重新序列化和摘要
+            previous = dict(self._tools)
+            stale_keys = self._schema_keys
+            schema_keys: dict[str, bytes] = {}
+            self._tools.clear()
             for tool in result.tools:
+                if tool.name in schema_keys:
+                    # 重复的工具名，后者覆盖前者
+                    _release_schema(schema_keys.pop(tool.name))
+                old = previous.get(tool.name)
+                if tool.name in stale_keys and old["inputSchema"] == tool.inputSchema:
+                    key, schema = stale_keys.pop(tool.name), old["inputSchema"]
+                else:
+                    key, schema = _intern_schema(tool.inputSchema)
+                if key is not None:
+                    schema_keys[tool.name] = key
                 self._tools[tool.name] = {
                     "name": tool.name,
                     "description": tool.description,
-                    "inputSchema": tool.inputSchema,
+                    "inputSchema": schema,
                 }
 
+            for key in stale_keys.values():
+                _release_schema(key)
+            self._schema_keys = schema_keys
+
             logger.debug(f"Fetched {len(self._tools)} tools from '{self.name}'")
         except asyncio.TimeoutError as e:
             raise MCPTimeoutError(self.timeout) from e
@@ -188,6 +307,13 @@ class MCPClientInstance:
             logger.error(f"Failed to fetch tools from '{self.name}': {e}")
             raise
 
+    def _clear_tools(self) -> None:
+        """Drop the tool list and release its interned schemas."""
+        for key in self._schema_keys.values():
+            _release_schema(key)
+        self._schema_keys = {}
+        self._tools.clear()
+
     async def call_tool(self, tool_name: str, arguments: dict[str, Any] | None = None) -> Any:
         """Call a tool on this instance.
 
@@ -202,37 +328,69 @@ class MCPClientInstance:
             ToolNotFoundError: If tool not found
             MCPTimeoutError: If operation times out
         """
-        if not self._connected or not self._session:
-            raise ConfigurationError(f"Instance '{self.name}' not connected")
+        self._active_calls += 1
+        try:
+            if self._idle_closed and self.is_active:
+                await self.ensure_connected()
 
-        if not self.is_active:
-            raise ConfigurationError(f"Instance '{self.name}' is not active")
+            if not self._connected or not self._session:
+                raise ConfigurationError(f"Instance '{self.name}' not connected")
 
-        if tool_name not in self._tools:
-            raise ToolNotFoundError(tool_name, self.name)
+            if not self.is_active:
+                raise ConfigurationError(f"Instance '{self.name}' is not active")
 
-        try:
-            logger.info(f"Calling tool '{tool_name}' on instance '{self.name}'")
+            if tool_name not in self._tools:
+                raise ToolNotFoundError(tool_name, self.name)
 
-            result = await asyncio.wait_for(
-                self._session.call_tool(tool_name, arguments or {}), timeout=self.timeout
-            )
+            try:
+                logger.info(f"Calling tool '{tool_name}' on instance '{self.name}'")
 
-            logger.debug(f"Tool '{tool_name}' completed successfully")
-            return result
-        except asyncio.TimeoutError as e:
-            raise MCPTimeoutError(self.timeout) from e
-        except Exception as e:
-            logger.error(f"Error calling tool '{tool_name}': {e}")
-            raise
+                result = await asyncio.wait_for(
+                    self._session.call_tool(tool_name, arguments or {}), timeout=self.timeout
+                )
 
-    def get_tools(self) -> dict[str, Any]:
+                logger.debug(f"Tool '{tool_name}' completed successfully")
+                return result
+            except asyncio.TimeoutError as e:
+                raise MCPTimeoutError(self.timeout) from e
+            except Exception as e:
+                logger.error(f"Error calling tool '{tool_name}': {e}")
+                raise
+        finally:
+            self._active_calls -= 1
+            self._last_used = time.monotonic()
+
+    async def close_if_idle(self, idle_timeout: float) -> bool:
+        """Disconnect the instance if it has not been used for a while.
+
+        The next tool call reconnects it.
+
+        Args:
+            idle_timeout: Seconds without a tool call before disconnecting
+
+        Returns:
+            True if the instance was disconnected
+        """
+        async with self._idle_lock:
+            if (
+                not self._connected
+                or self._active_calls
+                or time.monotonic() - self._last_used < idle_timeout
+            ):
+                return False
+
+            logger.info(f"Instance '{self.name}' idle for {idle_timeout}s, disconnecting")
+            self._idle_closed = True
+            await self.disconnect()
+            return True
+
+    def get_tools(self) -> Mapping[str, Any]:
         """Get available tools.
 
         Returns:
-            Dictionary of available tools
+            Read-only live view of available tools; use ``dict(...)`` for a snapshot
         """
-        return self._tools.copy()
+        return self._tools_view
 
     def is_connected(self) -> bool:
         """Check if instance is connected.
@@ -242,6 +400,14 @@ class MCPClientInstance:
         """
         return self._connected
 
+    def is_idle_closed(self) -> bool:
+        """Check if instance was disconnected for being idle and reconnects on use.
+
+        Returns:
+            True if idle-disconnected, False otherwise
+        """
+        return self._idle_closed
+
     def to_dict(self) -> dict[str, Any]:
         """Convert instance to dictionary.
 
@@ -263,17 +429,38 @@ class MCPClientInstance:
 class MCPClientManager:
     """Manages multiple MCP client instances."""
 
-    def __init__(self, data_path: str = "data", timeout: float = 30.0):
+    def __init__(self, data_path: str = "data", timeout: float = 30.0, idle_timeout: float = 0.0):
         """Initialize MCP client manager.
 
         Args:
             data_path: Path to data directory containing configurations
             timeout: Default timeout for operations
+            idle_timeout: Disconnect instances unused for this many seconds (0 disables)
         """
         self.data_path = Path(data_path)
         self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self._reaper_task: asyncio.Task | None = None
         self._instances: dict[str, MCPClientInstance] = {}
         self._provider_to_instance: dict[str, str] = {}  # provider名到instance名的映射
+        # 实例集合或状态每次变化时递增；以启动时间为起点，重启后也不会与旧值重复
+        self._version = time.time_ns()
+        self._all_tools_cache: dict[str, Any] | None = None
+
+    @property
+    def version(self) -> int:
+        """Version of the instance set, bumped on every add/remove/enable/disable
+        and whenever an instance connects or disconnects.
+
+        Returns:
+            Monotonically increasing version number
+        """
+        return self._version
+
+    def _mark_changed(self) -> None:
+        """Bump the version and drop the cached tool listing."""
+        self._version += 1
+        self._all_tools_cache = None
 
     async def load_configurations(self) -> None:
         """Load all MCP configurations from data directory."""
@@ -285,17 +472,38 @@ class MCPClientManager:
         config_files = list(self.data_path.glob("*/mcp_settings.json"))
         logger.info(f"Found {len(config_files)} configuration files")
 
-        for config_file in config_files:
-            try:
-                await self._load_config_file(config_file)
-            except Exception as e:
-                logger.error(f"Failed to load config {config_file}: {e}")
+        # 先在线程池中并行解析全部配置文件（不阻塞事件循环），再并发连接所有实例（有上限）；
+        # 同一文件中的多个服务器也并发连接，总耗时取决于最慢的实例而非所有实例之和
+        read_results = await asyncio.gather(
+            *(asyncio.to_thread(self._read_config_file, f) for f in config_files),
+            return_exceptions=True,
+        )
+        pending: list[tuple[dict[str, Any], str]] = []
+        for config_file, read_result in zip(config_files, read_results):
+            if isinstance(read_result, BaseException):
+                logger.error(f"Failed to load config {config_file}: {read_result}")
+            else:
+                pending.extend(read_result)
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_LOADS)
+
+        async def load_one(config: dict[str, Any], provider: str) -> None:
+            async with semaphore:
+                try:
+                    await self._create_instance_from_config(config, provider)
+                except Exception as e:
+                    logger.error(f"Failed to load instance for provider '{provider}': {e}")
+
+        await asyncio.gather(*(load_one(config, provider) for config, provider in pending))
 
-    async def _load_config_file(self, config_path: Path) -> None:
-        """Load a single configuration file.
+    def _read_config_file(self, config_path: Path) -> list[tuple[dict[str, Any], str]]:
+        """Read a single configuration file.
 
         Args:
             config_path: Path to configuration file
+
+        Returns:
+            (server config, provider name) pairs defined by the file
         """
         try:
             file_size = config_path.stat().st_size
@@ -304,16 +512,14 @@ class MCPClientManager:
                     f"Config file too large ({file_size} bytes): {config_path}. "
                     f"Maximum allowed: {MAX_CONFIG_FILE_SIZE} bytes"
                 )
-                return
+                return []
 
-            with open(config_path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = jsonio.load_file(config_path)
 
+            provider = config_path.parent.name
             if "mcpServers" in data:
-                for _server_name, server_config in data["mcpServers"].items():
-                    await self._create_instance_from_config(server_config, config_path.parent.name)
-            else:
-                await self._create_instance_from_config(data, config_path.parent.name)
+                return [(server_config, provider) for server_config in data["mcpServers"].values()]
+            return [(data, provider)]
         except Exception as e:
             logger.error(f"Error loading config from {config_path}: {e}")
             raise
@@ -340,6 +546,7 @@ class MCPClientManager:
                 is_active=validated_config.get("isActive", True),
                 metadata=validated_config.get("metadata", {}),
                 timeout=self.timeout,
+                on_change=self._mark_changed,
             )
 
             if instance.is_active:
@@ -348,6 +555,7 @@ class MCPClientManager:
             self._instances[instance.name] = instance
             # 建立provider到instance的映射，支持用provider名查找
             self._provider_to_instance[instance.provider] = instance.name
+            self._mark_changed()
             logger.info(f"Instance '{instance.name}' loaded successfully")
         except Exception as e:
             logger.error(f"Failed to create instance from config: {e}")
@@ -375,18 +583,24 @@ class MCPClientManager:
             raise ConfigurationError(f"Instance '{instance_name}' already exists")
 
         if save_to_file:
-            provider_path = self.data_path / provider
-            provider_path.mkdir(parents=True, exist_ok=True)
-
-            config_path = provider_path / "mcp_settings.json"
-            with open(config_path, "w", encoding="utf-8") as f:
-                json.dump(validated_config, f, indent=2, ensure_ascii=False)
+            await asyncio.to_thread(self._write_config_file, provider, validated_config)
 
         await self._create_instance_from_config(validated_config, provider)
         # 映射关系在_create_instance_from_config中已经建立
 
         return instance_name
 
+    def _write_config_file(self, provider: str, config: dict[str, Any]) -> None:
+        """Write a provider's configuration file.
+
+        Args:
+            provider: Provider name
+            config: Validated instance configuration
+        """
+        provider_path = self.data_path / provider
+        provider_path.mkdir(parents=True, exist_ok=True)
+        jsonio.dump_file(provider_path / "mcp_settings.json", config, indent=True)
+
     async def remove_instance(self, instance_name: str, delete_file: bool = True) -> None:
         """Remove an instance.
 
@@ -412,6 +626,7 @@ class MCPClientManager:
             del self._provider_to_instance[instance.provider]
 
         del self._instances[instance_name]
+        self._mark_changed()
         logger.info(f"Instance '{instance_name}' removed")
 
     async def enable_instance(self, instance_name: str) -> None:
@@ -426,8 +641,11 @@ class MCPClientManager:
         instance = self._instances[instance_name]
         instance.is_active = True
 
-        if not instance.is_connected():
-            await instance.connect()
+        try:
+            await instance.ensure_connected()
+        finally:
+            # 连接失败时 is_active 也已改变
+            self._mark_changed()
 
         logger.info(f"Instance '{instance_name}' enabled")
 
@@ -442,6 +660,10 @@ class MCPClientManager:
 
         instance = self._instances[instance_name]
         instance.is_active = False
+        if instance.is_idle_closed():
+            # 禁用后不再按需重连，清除空闲断开时保留的工具列表
+            await instance.disconnect()
+        self._mark_changed()
 
         logger.info(f"Instance '{instance_name}' disabled")
 
@@ -482,12 +704,18 @@ class MCPClientManager:
     def get_all_tools(self) -> dict[str, Any]:
         """Get all tools from all instances.
 
+        The listing is cached until the instance set or any connection changes;
+        callers share the returned dictionary and must not modify it.
+
         Returns:
             Dictionary with instance info and their tools
         """
+        if self._all_tools_cache is not None:
+            return self._all_tools_cache
+
         result = {}
         for name, instance in self._instances.items():
-            if instance.is_active and instance.is_connected():
+            if instance.is_active and (instance.is_connected() or instance.is_idle_closed()):
                 tools = instance.get_tools()
                 if tools:  # Only include instances with tools
                     result[name] = {
@@ -496,12 +724,33 @@ class MCPClientManager:
                         "tools": list(tools.values()),
                     }
 
+        self._all_tools_cache = result
         return result
 
+    def start_idle_reaper(self) -> None:
+        """Start the background task that disconnects idle instances, if enabled."""
+        if self.idle_timeout > 0 and self._reaper_task is None:
+            self._reaper_task = asyncio.create_task(self._reap_idle(), name="idle_reaper")
+
+    async def _reap_idle(self) -> None:
+        """Periodically disconnect instances idle for longer than idle_timeout."""
+        interval = min(IDLE_CHECK_INTERVAL, self.idle_timeout)
+        while True:
+            await asyncio.sleep(interval)
+            for instance in list(self._instances.values()):
+                try:
+                    await instance.close_if_idle(self.idle_timeout)
+                except Exception as e:
+                    logger.warning(f"Failed to disconnect idle instance '{instance.name}': {e}")
+
     async def shutdown(self) -> None:
         """Shutdown all instances with timeout protection."""
         logger.info("Shutting down all MCP instances...")
 
+        if self._reaper_task:
+            self._reaper_task.cancel()
+            self._reaper_task = None
+
         # 并发断开所有实例，提高退出速度
         disconnect_tasks = []
         for instance in self._instances.values():
@@ -1,5 +1,7 @@
 """MCP Router - Core routing logic."""
 
+import asyncio
+from collections.abc import Sequence
 from typing import Any
 
 from ..core.logger import get_logger
@@ -98,6 +100,58 @@ class MCPRouter:
 
         return result
 
+    # Sequence rather than list in the annotations: the list() method shadows the builtin here
+    async def batch_call(
+        self,
+        operations: Sequence[dict[str, Any]],
+        max_concurrent: int = 8,
+        stop_on_error: bool = False,
+    ) -> Sequence[dict[str, Any]]:
+        """Call several tools concurrently.
+
+        Args:
+            operations: Calls to make, each with 'instance_name', 'tool_name' and
+                optional 'arguments'
+            max_concurrent: Maximum number of calls in flight at once
+            stop_on_error: Skip calls that have not started yet once any call fails
+
+        Returns:
+            One entry per operation, in order, with 'index', 'tool', 'success' and
+            either 'result' or 'error'/'code'
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrent))
+        failed = asyncio.Event()
+
+        async def run_one(index: int, operation: dict[str, Any]) -> dict[str, Any]:
+            entry: dict[str, Any] = {"index": index, "tool": None}
+            async with semaphore:
+                # 单个操作格式错误只影响它自己的结果，不会中断整个批次
+                try:
+                    entry["tool"] = operation.get("tool_name")
+                    if stop_on_error and failed.is_set():
+                        return {
+                            **entry,
+                            "success": False,
+                            "error": "Skipped after an earlier call failed",
+                            "code": "SKIPPED",
+                        }
+                    result = await self.call(
+                        operation["instance_name"],
+                        entry["tool"],
+                        **operation.get("arguments", {}),
+                    )
+                except Exception as e:
+                    failed.set()
+                    return {
+                        **entry,
+                        "success": False,
+                        "error": str(e),
+                        "code": getattr(e, "code", "INTERNAL_ERROR"),
+                    }
+            return {**entry, "success": True, "result": result}
+
+        return await asyncio.gather(*(run_one(i, op) for i, op in enumerate(operations)))
+
     async def remove(self, instance_name: str) -> str:
         """Remove an MCP configuration.
 
@@ -1,8 +1,7 @@
 """MCP Server implementation."""
 
-import json
 import sys
-from collections.abc import Sequence
+from collections.abc import Awaitable, Callable, Sequence
 from typing import Any
 
 from mcp.server.stdio import stdio_server
@@ -10,7 +9,8 @@ from mcp.types import TextContent, Tool
 
 from mcp.server import Server
 
-from .. import __version__
+from ..core import jsonio
+from ..core.exceptions import ValidationError
 from ..core.logger import get_logger
 from .router import MCPRouter
 
@@ -26,6 +26,34 @@ except ImportError:
     SSE_AVAILABLE = False
     logger.warning("SSE transport not available. Install mcp[sse] for SSE support.")
 
+# 修改实例配置的工具，仅在 allow_instance_management 开启时可用
+_MANAGEMENT_TOOLS = frozenset(
+    {"mcp.router.add", "mcp.router.remove", "mcp.router.enable", "mcp.router.disable"}
+)
+
+
+def _serialize_call_result(call_result: Any) -> Any:
+    """Convert a CallToolResult into JSON-serializable content.
+
+    Args:
+        call_result: Result returned by the downstream MCP instance
+
+    Returns:
+        List of content entries, or the result's string form
+    """
+    if not hasattr(call_result, "content"):
+        return str(call_result)
+
+    result = []
+    for content_item in call_result.content:
+        if hasattr(content_item, "text"):
+            result.append({"type": "text", "text": content_item.text})
+        elif hasattr(content_item, "data"):
+            result.append({"type": "image", "data": content_item.data})
+        else:
+            result.append(str(content_item))
+    return result
+
 
 class MCPServer:
     """MCP Server that exposes router tools to LLMs."""
@@ -51,155 +79,212 @@ class MCPServer:
         self.transport_type = transport_type
         self.server = Server(name)
 
+        # 工具定义是静态的，构建一次后复用（HTTP 模式直接复用序列化后的字典）
+        self._tools = self._build_tools()
+        self._tools_payload = [tool.model_dump(exclude_none=True) for tool in self._tools]
+
         self._register_handlers()
+        # 依赖已注册的处理器，注册完成后生成一次
+        self._init_options = self.server.create_initialization_options()
 
-    def _register_handlers(self) -> None:
-        """Register MCP server handlers."""
+    def _build_tools(self) -> list[Tool]:
+        """Build the router tool definitions exposed to LLMs.
 
-        # 定义处理器函数，同时保存引用供 HTTP 模式使用
-        async def list_tools_impl() -> list[Tool]:
-            """List all available router tools."""
-            # 基础只读工具（总是可用）
-            tools = [
+        The set only depends on ``allow_instance_management``, so it is built once.
+
+        Returns:
+            Router tools
+        """
+        # 基础只读工具（总是可用）
+        tools = [
+            Tool(
+                name="mcp.router.use",
+                description="Use a specific MCP instance and return its available tools",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "instance_name": {
+                            "type": "string",
+                            "description": "Name of the MCP instance to use",
+                        }
+                    },
+                    "required": ["instance_name"],
+                },
+            ),
+            Tool(
+                name="mcp.router.list",
+                description=(
+                    "List all registered MCP client instances with their names and providers. "
+                    "Use the 'name' field (or 'provider' field) when calling tools."
+                ),
+                inputSchema={"type": "object", "properties": {}},
+            ),
+            Tool(
+                name="mcp.router.help",
+                description="Get help information for all available tools across all instances",
+                inputSchema={"type": "object", "properties": {}},
+            ),
+            Tool(
+                name="mcp.router.call",
+                description=(
+                    "Call a tool on a specific instance. "
+                    "Use either the full instance name or provider name as instance_name. "
+                    "Use mcp.router.help to see available tools for each instance."
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "instance_name": {
+                            "type": "string",
+                            "description": "Instance name or provider name (e.g., 'napcat_api_doc' or full instance name)",
+                        },
+                        "tool_name": {
+                            "type": "string",
+                            "description": "Name of the tool to call",
+                        },
+                        "arguments": {"type": "object", "description": "Tool arguments"},
+                    },
+                    "required": ["instance_name", "tool_name"],
+                },
+            ),
+            Tool(
+                name="mcp.router.batch_call",
+                description=(
+                    "Call several tools in one request; independent calls run concurrently. "
+                    "Results are returned in the order of 'operations'."
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "operations": {
+                            "type": "array",
+                            "description": "Tool calls to make",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "instance_name": {"type": "string"},
+                                    "tool_name": {"type": "string"},
+                                    "arguments": {"type": "object"},
+                                },
+                                "required": ["instance_name", "tool_name"],
+                            },
+                        },
+                        "maxConcurrent": {
+                            "type": "integer",
+                            "description": "Maximum number of calls in flight (default 8)",
+                            "minimum": 1,
+                        },
+                        "stopOnError": {
+                            "type": "boolean",
+                            "description": "Skip calls not yet started after a failure",
+                        },
+                    },
+                    "required": ["operations"],
+                },
+            ),
+        ]
+
+        # 管理工具（仅当允许时才添加）
+        if self.allow_instance_management:
+            management_tools = [
+                Tool(
+                    name="mcp.router.add",
+                    description="Add a new MCP configuration dynamically",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "provider_name": {
+                                "type": "string",
+                                "description": "Provider name (alphanumeric and underscores only)",
+                            },
+                            "config": {
+                                "type": "object",
+                                "description": "MCP configuration object",
+                                "properties": {
+                                    "name": {"type": "string"},
+                                    "type": {
+                                        "type": "string",
+                                        "enum": ["stdio", "sse", "http"],
+                                    },
+                                    "command": {"type": "string"},
+                                    "args": {"type": "array", "items": {"type": "string"}},
+                                    "env": {"type": "object"},
+                                    "isActive": {"type": "boolean"},
+                                },
+                                "required": ["name", "type", "command"],
+                            },
+                        },
+                        "required": ["provider_name", "config"],
+                    },
+                ),
                 Tool(
-                    name="mcp.router.use",
-                    description="Use a specific MCP instance and return its available tools",
+                    name="mcp.router.remove",
+                    description="Remove an MCP configuration",
                     inputSchema={
                         "type": "object",
                         "properties": {
                             "instance_name": {
                                 "type": "string",
-                                "description": "Name of the MCP instance to use",
+                                "description": "Name of instance to remove",
                             }
                         },
                         "required": ["instance_name"],
                     },
                 ),
                 Tool(
-                    name="mcp.router.list",
-                    description=(
-                        "List all registered MCP client instances with their names and providers. "
-                        "Use the 'name' field (or 'provider' field) when calling tools."
-                    ),
-                    inputSchema={"type": "object", "properties": {}},
-                ),
-                Tool(
-                    name="mcp.router.help",
-                    description="Get help information for all available tools across all instances",
-                    inputSchema={"type": "object", "properties": {}},
+                    name="mcp.router.disable",
+                    description="Disable an MCP instance without removing its configuration",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "instance_name": {
+                                "type": "string",
+                                "description": "Name of instance to disable",
+                            }
+                        },
+                        "required": ["instance_name"],
+                    },
                 ),
                 Tool(
-                    name="mcp.router.call",
-                    description=(
-                        "Call a tool on a specific instance. "
-                        "Use either the full instance name or provider name as instance_name. "
-                        "Use mcp.router.help to see available tools for each instance."
-                    ),
+                    name="mcp.router.enable",
+                    description="Enable a previously disabled MCP instance",
                     inputSchema={
                         "type": "object",
                         "properties": {
                             "instance_name": {
                                 "type": "string",
-                                "description": "Instance name or provider name (e.g., 'napcat_api_doc' or full instance name)",
-                            },
-                            "tool_name": {
-                                "type": "string",
-                                "description": "Name of the tool to call",
-                            },
-                            "arguments": {"type": "object", "description": "Tool arguments"},
+                                "description": "Name of instance to enable",
+                            }
                         },
-                        "required": ["instance_name", "tool_name"],
+                        "required": ["instance_name"],
                     },
                 ),
             ]
+            tools.extend(management_tools)
 
-            # 管理工具（仅当允许时才添加）
-            if self.allow_instance_management:
-                management_tools = [
-                    Tool(
-                        name="mcp.router.add",
-                        description="Add a new MCP configuration dynamically",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "provider_name": {
-                                    "type": "string",
-                                    "description": "Provider name (alphanumeric and underscores only)",
-                                },
-                                "config": {
-                                    "type": "object",
-                                    "description": "MCP configuration object",
-                                    "properties": {
-                                        "name": {"type": "string"},
-                                        "type": {
-                                            "type": "string",
-                                            "enum": ["stdio", "sse", "http"],
-                                        },
-                                        "command": {"type": "string"},
-                                        "args": {"type": "array", "items": {"type": "string"}},
-                                        "env": {"type": "object"},
-                                        "isActive": {"type": "boolean"},
-                                    },
-                                    "required": ["name", "type", "command"],
-                                },
-                            },
-                            "required": ["provider_name", "config"],
-                        },
-                    ),
-                    Tool(
-                        name="mcp.router.remove",
-                        description="Remove an MCP configuration",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "instance_name": {
-                                    "type": "string",
-                                    "description": "Name of instance to remove",
-                                }
-                            },
-                            "required": ["instance_name"],
-                        },
-                    ),
-                    Tool(
-                        name="mcp.router.disable",
-                        description="Disable an MCP instance without removing its configuration",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "instance_name": {
-                                    "type": "string",
-                                    "description": "Name of instance to disable",
-                                }
-                            },
-                            "required": ["instance_name"],
-                        },
-                    ),
-                    Tool(
-                        name="mcp.router.enable",
-                        description="Enable a previously disabled MCP instance",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "instance_name": {
-                                    "type": "string",
-                                    "description": "Name of instance to enable",
-                                }
-                            },
-                            "required": ["instance_name"],
-                        },
-                    ),
-                ]
-                tools.extend(management_tools)
-
-            return tools
+        return tools
 
-        # 保存引用供 HTTP 模式使用
-        self._list_tools_impl = list_tools_impl
+    def _register_handlers(self) -> None:
+        """Register MCP server handlers."""
 
-        # 注册到 MCP server
+        # 注册到 MCP server（HTTP 模式直接使用 self._tools_payload）
         @self.server.list_tools()
         async def list_tools() -> list[Tool]:
-            return await list_tools_impl()
+            """List all available router tools."""
+            return self._tools
+
+        # 工具名到处理函数的分发表，一次哈希查找即可定位处理函数
+        tool_handlers: dict[str, Callable[[dict[str, Any]], Awaitable[Any]]] = {
+            "mcp.router.use": self._tool_use,
+            "mcp.router.list": self._tool_list,
+            "mcp.router.help": self._tool_help,
+            "mcp.router.call": self._tool_call,
+            "mcp.router.batch_call": self._tool_batch_call,
+            "mcp.router.add": self._tool_add,
+            "mcp.router.remove": self._tool_remove,
+            "mcp.router.disable": self._tool_disable,
+            "mcp.router.enable": self._tool_enable,
+        }
 
         async def call_tool_impl(name: str, arguments: dict[str, Any]) -> Sequence[TextContent]:
             """Handle tool calls."""
@@ -207,64 +292,26 @@ class MCPServer:
                 logger.info(f"Received tool call: {name}")
 
                 # 检查管理工具权限
-                management_tools = {
-                    "mcp.router.add",
-                    "mcp.router.remove",
-                    "mcp.router.enable",
-                    "mcp.router.disable",
-                }
-                if name in management_tools and not self.allow_instance_management:
+                if name in _MANAGEMENT_TOOLS and not self.allow_instance_management:
                     raise PermissionError(
                         f"Instance management is disabled. Tool '{name}' is not available. "
                         "Enable 'server.allow_instance_management' in config.json to use this tool."
                     )
 
-                result = None
-
-                if name == "mcp.router.use":
-                    result = await self.router.use(arguments["instance_name"])
-                elif name == "mcp.router.list":
-                    result = self.router.list()
-                elif name == "mcp.router.help":
-                    result = self.router.help()
-                elif name == "mcp.router.add":
-                    result = await self.router.add(arguments["provider_name"], arguments["config"])
-                elif name == "mcp.router.call":
-                    call_result = await self.router.call(
-                        arguments["instance_name"],
-                        arguments["tool_name"],
-                        **arguments.get("arguments", {}),
-                    )
-                    # Extract content from CallToolResult
-                    if hasattr(call_result, "content"):
-                        # Convert content list to serializable format
-                        result = []
-                        for content_item in call_result.content:
-                            if hasattr(content_item, "text"):
-                                result.append({"type": "text", "text": content_item.text})
-                            elif hasattr(content_item, "data"):
-                                result.append({"type": "image", "data": content_item.data})
-                            else:
-                                result.append(str(content_item))
-                    else:
-                        result = str(call_result)
-                elif name == "mcp.router.remove":
-                    result = await self.router.remove(arguments["instance_name"])
-                elif name == "mcp.router.disable":
-                    result = await self.router.disable(arguments["instance_name"])
-                elif name == "mcp.router.enable":
-                    result = await self.router.enable(arguments["instance_name"])
-                else:
+                handler = tool_handlers.get(name)
+                if handler is None:
                     raise ValueError(f"Unknown tool: {name}")
+                result = await handler(arguments)
 
-                result_text = json.dumps(result, ensure_ascii=False, indent=2)
+                # 紧凑输出即可，LLM 不需要缩进；无法序列化的对象退化为字符串
+                result_text = jsonio.dumps(result, default=str)
 
                 return [TextContent(type="text", text=result_text)]
             except Exception as e:
                 logger.error(f"Error handling tool call '{name}': {e}")
-                error_text = json.dumps(
+                error_text = jsonio.dumps(
                     {"error": str(e), "code": getattr(e, "code", "INTERNAL_ERROR")},
-                    ensure_ascii=False,
+                    default=str,
                 )
                 return [TextContent(type="text", text=error_text)]
 
@@ -276,6 +323,64 @@ class MCPServer:
         async def call_tool(name: str, arguments: dict[str, Any]) -> Sequence[TextContent]:
             return await call_tool_impl(name, arguments)
 
+    async def _tool_use(self, arguments: dict[str, Any]) -> Any:
+        """Handle mcp.router.use."""
+        return await self.router.use(arguments["instance_name"])
+
+    async def _tool_list(self, arguments: dict[str, Any]) -> Any:
+        """Handle mcp.router.list."""
+        return self.router.list()
+
+    async def _tool_help(self, arguments: dict[str, Any]) -> Any:
+        """Handle mcp.router.help."""
+        return self.router.help()
+
+    async def _tool_call(self, arguments: dict[str, Any]) -> Any:
+        """Handle mcp.router.call."""
+        call_result = await self.router.call(
+            arguments["instance_name"],
+            arguments["tool_name"],
+            **arguments.get("arguments", {}),
+        )
+        return _serialize_call_result(call_result)
+
+    async def _tool_batch_call(self, arguments: dict[str, Any]) -> Any:
+        """Handle mcp.router.batch_call."""
+        # HTTP 模式不会按 inputSchema 校验参数，这里自行检查
+        operations = arguments.get("operations")
+        if not isinstance(operations, list) or not all(isinstance(op, dict) for op in operations):
+            raise ValidationError("'operations' must be a list of objects")
+        try:
+            max_concurrent = max(1, int(arguments.get("maxConcurrent", 8)))
+        except (TypeError, ValueError):
+            raise ValidationError("'maxConcurrent' must be an integer") from None
+
+        results = await self.router.batch_call(
+            operations,
+            max_concurrent=max_concurrent,
+            stop_on_error=bool(arguments.get("stopOnError", False)),
+        )
+        for entry in results:
+            if entry["success"]:
+                entry["result"] = _serialize_call_result(entry["result"])
+        return results
+
+    async def _tool_add(self, arguments: dict[str, Any]) -> Any:
+        """Handle mcp.router.add."""
+        return await self.router.add(arguments["provider_name"], arguments["config"])
+
+    async def _tool_remove(self, arguments: dict[str, Any]) -> Any:
+        """Handle mcp.router.remove."""
+        return await self.router.remove(arguments["instance_name"])
+
+    async def _tool_disable(self, arguments: dict[str, Any]) -> Any:
+        """Handle mcp.router.disable."""
+        return await self.router.disable(arguments["instance_name"])
+
+    async def _tool_enable(self, arguments: dict[str, Any]) -> Any:
+        """Handle mcp.router.enable."""
+        return await self.router.enable(arguments["instance_name"])
+
     async def _handle_http_method(self, method: str, params: dict[str, Any]) -> dict[str, Any]:
         """Handle HTTP MCP method calls.
 
@@ -291,9 +396,8 @@ class MCPServer:
         """
         if method == "tools/list":
             logger.info("HTTP MCP: Listing tools")
-            tools = await self._list_tools_impl()
-            result = {"tools": [tool.model_dump(exclude_none=True) for tool in tools]}
-            logger.info(f"HTTP MCP: Returning {len(tools)} tools")
+            result = {"tools": self._tools_payload}
+            logger.info(f"HTTP MCP: Returning {len(self._tools_payload)} tools")
             return result
 
         elif method == "tools/call":
@@ -325,9 +429,7 @@ class MCPServer:
             logger.info(f"Starting MCP server '{self.name}' with stdio transport...")
             try:
                 async with stdio_server() as (read_stream, write_stream):
-                    await self.server.run(
-                        read_stream, write_stream, self.server.create_initialization_options()
-                    )
+                    await self.server.run(read_stream, write_stream, self._init_options)
             except (BrokenPipeError, ConnectionError, OSError) as e:
                 logger.info(f"Stdio connection closed: {e}")
                 sys.exit(0)
@@ -362,9 +464,7 @@ class MCPServer:
                     async with sse_transport.connect_sse(
                         request.scope, request.receive, request._send
                     ) as streams:
-                        await self.server.run(
-                            streams[0], streams[1], self.server.create_initialization_options()
-                        )
+                        await self.server.run(streams[0], streams[1], self._init_options)
 
                 # 使用ASGI接口直接处理POST消息
                 async def handle_post_message_asgi(scope, receive, send):
@@ -399,6 +499,8 @@ class MCPServer:
 
                         # 处理 initialize 方法
                         if method == "initialize":
+                            from .. import __version__
+
                             _session_initialized = True
                             result = {
                                 "protocolVersion": "2024-11-05",
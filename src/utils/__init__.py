@@ -1,11 +1,32 @@
 """Utility modules for MCP Router."""
 
-from .security import SecurityManager
-from .validator import InputValidator
-from .watcher import FileWatcher
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .security import SecurityManager
+    from .validator import InputValidator
+    from .watcher import FileWatcher
+
+# 按需导入：watcher 依赖 watchdog，仅在实际使用 FileWatcher 时加载
+_LAZY_IMPORTS = {
+    "InputValidator": ".validator",
+    "SecurityManager": ".security",
+    "FileWatcher": ".watcher",
+}
 
 __all__ = [
     "InputValidator",
     "SecurityManager",
     "FileWatcher",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access (PEP 562)."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,5 +1,7 @@
 """Security utilities for MCP Router."""
 
+import hmac
+
 from ..core.exceptions import SecurityError
 from ..core.logger import get_logger
 
@@ -18,6 +20,8 @@ class SecurityManager:
         """
         self.bearer_token = bearer_token
         self.enable_validation = enable_validation
+        # Resolved once so per-request checks can skip all work when auth is off
+        self.auth_required = bool(enable_validation and bearer_token)
 
         if bearer_token:
             logger.info("Bearer token authentication enabled")
@@ -45,9 +49,27 @@ class SecurityManager:
         if not token:
             raise SecurityError("Bearer token required but not provided")
 
-        token = token.replace("Bearer ", "").strip()
+        return self.validate_token_value(token.replace("Bearer ", "").strip())
+
+    def validate_token_value(self, token: str) -> bool:
+        """Validate a bare token value (without the ``Bearer`` scheme).
+
+        Args:
+            token: Token value to validate
+
+        Returns:
+            True if valid
+
+        Raises:
+            SecurityError: If authentication is required but token is invalid
+        """
+        if not self.auth_required:
+            return True
+
+        if not token:
+            raise SecurityError("Bearer token required but not provided")
 
-        if token != self.bearer_token:
+        if not hmac.compare_digest(token.encode(), self.bearer_token.encode()):
             logger.warning("Invalid bearer token attempt")
             raise SecurityError("Invalid bearer token")
 
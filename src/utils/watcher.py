@@ -70,6 +70,23 @@ class ConfigFileHandler(FileSystemEventHandler):
 
         self._handle_change(event.src_path, "deleted")
 
+    def on_moved(self, event: FileSystemEvent) -> None:
+        """Handle file move event.
+
+        Atomic writes replace the config by renaming a temporary file onto it,
+        which is reported as a move whose destination is the config file.
+
+        Args:
+            event: File system event
+        """
+        if event.is_directory:
+            return
+
+        if not event.dest_path.endswith("mcp_settings.json"):
+            return
+
+        self._handle_change(event.dest_path, "modified")
+
     def _handle_change(self, path: str, event_type: str) -> None:
         """Handle file change with debouncing.
 
@@ -85,9 +102,9 @@ class ConfigFileHandler(FileSystemEventHandler):
 
         self._last_modified[path] = current_time
 
-        # Send event to main process via queue
+        # Send event to main process via queue as a compact (path, event_type) tuple
         try:
-            self.queue.put_nowait({"path": path, "event_type": event_type})
+            self.queue.put_nowait((path, event_type))
         except Exception:
             pass  # Queue might be full, skip this event
 
@@ -114,13 +131,12 @@ def _watch_process(watch_path: str, queue: Queue, debounce_delay: float):
     observer.start()
 
     try:
-        # Keep subprocess running
-        while True:
-            time.sleep(1)
+        # Keep subprocess running until the observer thread exits; no periodic wakeups
+        observer.join()
     except KeyboardInterrupt:
         observer.stop()
-    finally:
         observer.join()
+    finally:
         subprocess_logger.info("File watcher subprocess stopped")
 
 
@@ -148,7 +164,7 @@ class FileWatcher:
         """Start watching for file changes in subprocess.
 
         Returns:
-            Queue to receive file change events
+            Queue to receive ``(path, event_type)`` file change events
         """
         if self._running:
             logger.warning("File watcher already running")
@@ -181,6 +197,13 @@ class FileWatcher:
 
         logger.info("Stopping file watcher subprocess...")
 
+        # 通知主进程中阻塞读取队列的线程退出
+        if self._queue is not None:
+            try:
+                self._queue.put_nowait(None)
+            except Exception:
+                pass
+
         # Terminate subprocess
         if self._process.is_alive():
             self._process.terminate()
@@ -2,27 +2,44 @@
 
 import asyncio
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 from fastapi import WebSocket
 
 
+# 每个客户端最多缓存的日志条数，慢速客户端溢出时丢弃最旧的记录
+CLIENT_QUEUE_SIZE = 1024
+# 每次发送合并的日志上限（字符数），超过后立即发送
+MAX_BATCH_CHARS = 64 * 1024
+
+
 class WebSocketLogHandler(logging.Handler):
-    """日志处理器，将日志广播到所有WebSocket客户端."""
+    """日志处理器，将日志广播到所有WebSocket客户端.
+
+    每个客户端拥有一个有界队列，由各自的 pump 任务批量发送，
+    慢速客户端不会阻塞其他客户端，也不会导致内存无限增长.
+    """
 
     def __init__(self):
         """初始化WebSocket日志处理器."""
         super().__init__()
-        self.clients: set[WebSocket] = set()
-        self._lock = asyncio.Lock()
+        self.clients: dict[WebSocket, asyncio.Queue[str]] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
 
-    async def add_client(self, websocket: WebSocket) -> None:
+    async def add_client(self, websocket: WebSocket) -> asyncio.Queue[str]:
         """添加WebSocket客户端.
 
         Args:
             websocket: WebSocket连接
+
+        Returns:
+            该客户端的日志队列
         """
-        async with self._lock:
-            self.clients.add(websocket)
+        self._loop = asyncio.get_running_loop()
+        client_queue: asyncio.Queue[str] = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        self.clients[websocket] = client_queue
+        return client_queue
 
     async def remove_client(self, websocket: WebSocket) -> None:
         """移除WebSocket客户端.
@@ -30,52 +47,104 @@ class WebSocketLogHandler(logging.Handler):
         Args:
             websocket: WebSocket连接
         """
-        async with self._lock:
-            self.clients.discard(websocket)
+        self.clients.pop(websocket, None)
+
+    def has_clients(self, record: logging.LogRecord) -> bool:
+        """日志过滤器：没有客户端连接时直接丢弃记录，不进入队列.
+
+        Args:
+            record: 日志记录
+
+        Returns:
+            是否有WebSocket客户端连接
+        """
+        return bool(self.clients)
 
     def emit(self, record: logging.LogRecord) -> None:
         """发送日志记录到所有WebSocket客户端.
 
+        由 QueueListener 线程调用，格式化后交给事件循环分发.
+
         Args:
             record: 日志记录
         """
-        if not self.clients:
+        loop = self._loop
+        if not self.clients or loop is None:
             return
 
         try:
             msg = self.format(record)
-            # 在事件循环中异步发送
-            asyncio.create_task(self._broadcast(msg))
+            loop.call_soon_threadsafe(self._publish, msg)
+        except RuntimeError:
+            # 事件循环已关闭
+            pass
         except Exception:
             self.handleError(record)
 
-    async def _broadcast(self, message: str) -> None:
-        """广播消息到所有客户端.
+    def _publish(self, message: str) -> None:
+        """将消息放入每个客户端的队列（在事件循环中调用）.
 
         Args:
             message: 要广播的消息
         """
-        if not self.clients:
-            return
+        for client_queue in self.clients.values():
+            try:
+                client_queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # 丢弃最旧的记录，保留最新日志
+                client_queue.get_nowait()
+                client_queue.put_nowait(message)
+
+    async def pump(self, websocket: WebSocket, client_queue: asyncio.Queue[str]) -> None:
+        """持续将客户端队列中的日志批量发送给客户端.
 
-        disconnected_clients = set()
-        async with self._lock:
-            clients_copy = self.clients.copy()
+        每次等待一条记录，再合并队列中已积压的记录（最多约 MAX_BATCH_CHARS 个字符）
+        作为一个消息发送. 发送失败时移除该客户端并退出.
+
+        Args:
+            websocket: WebSocket连接
+            client_queue: 该客户端的日志队列
+        """
+        while True:
+            message = await client_queue.get()
+            batch = [message]
+            size = len(message)
+            while size < MAX_BATCH_CHARS and not client_queue.empty():
+                message = client_queue.get_nowait()
+                batch.append(message)
+                size += len(message) + 1
 
-        for client in clients_copy:
             try:
-                await client.send_text(message)
+                await websocket.send_text("\n".join(batch))
             except Exception:
-                disconnected_clients.add(client)
+                await self.remove_client(websocket)
+                return
+
 
-        # 移除断开连接的客户端
-        if disconnected_clients:
-            async with self._lock:
-                self.clients -= disconnected_clients
+class _RawQueueHandler(QueueHandler):
+    """原样入队日志记录的 QueueHandler.
+
+    默认的 prepare() 会在记录日志的线程上格式化消息和异常堆栈并复制记录；
+    队列不会离开本进程，因此直接入队原记录，格式化全部留给监听线程.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """返回未经格式化的原记录.
+
+        Args:
+            record: 日志记录
+
+        Returns:
+            同一条日志记录
+        """
+        return record
 
 
 # 全局WebSocket日志处理器实例
 _ws_log_handler: WebSocketLogHandler | None = None
+# 记录日志的线程只把记录放入队列，由监听线程格式化并转交事件循环发送
+_ws_queue_handler: QueueHandler | None = None
+_ws_queue_listener: QueueListener | None = None
 
 
 def get_websocket_handler() -> WebSocketLogHandler:
@@ -100,6 +169,10 @@ def enable_websocket_logging(
         level: 日志级别
         log_format: 日志格式
     """
+    global _ws_queue_handler, _ws_queue_listener
+    if _ws_queue_listener is not None:
+        return
+
     handler = get_websocket_handler()
     numeric_level = getattr(logging, level.upper(), logging.INFO)
     handler.setLevel(numeric_level)
@@ -107,14 +180,31 @@ def enable_websocket_logging(
     formatter = logging.Formatter(log_format)
     handler.setFormatter(formatter)
 
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = _RawQueueHandler(log_queue)
+    queue_handler.setLevel(numeric_level)
+    queue_handler.addFilter(handler.has_clients)
+
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+
     root_logger = logging.getLogger()
-    root_logger.addHandler(handler)
+    root_logger.addHandler(queue_handler)
+
+    _ws_queue_handler = queue_handler
+    _ws_queue_listener = listener
 
 
 def disable_websocket_logging() -> None:
     """禁用WebSocket日志广播."""
-    global _ws_log_handler
+    global _ws_log_handler, _ws_queue_handler, _ws_queue_listener
+    root_logger = logging.getLogger()
+    if _ws_queue_handler is not None:
+        root_logger.removeHandler(_ws_queue_handler)
+        _ws_queue_handler = None
+    if _ws_queue_listener is not None:
+        _ws_queue_listener.stop()
+        _ws_queue_listener = None
     if _ws_log_handler is not None:
-        root_logger = logging.getLogger()
         root_logger.removeHandler(_ws_log_handler)
         _ws_log_handler = None
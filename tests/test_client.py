@@ -0,0 +1,207 @@
+"""Tests for MCP client instance lifecycle."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.mcp import client
+
+
+class FakeTransport:
+    """Transport context that records whether it was exited."""
+
+    def __init__(self):
+        self.exited = False
+        self.exit_delay = 0.0
+
+    async def __aenter__(self):
+        # 让出事件循环，模拟启动子进程的耗时
+        await asyncio.sleep(0)
+        return object(), object()
+
+    async def __aexit__(self, *exc_info):
+        await asyncio.sleep(self.exit_delay)
+        self.exited = True
+
+
+class FakeSession:
+    """ClientSession stand-in exposing a single 'echo' tool."""
+
+    def __init__(self, read_stream, write_stream):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    async def initialize(self):
+        pass
+
+    async def list_tools(self):
+        tool = SimpleNamespace(name="echo", description="Echo", inputSchema={"type": "object"})
+        return SimpleNamespace(tools=[tool])
+
+    async def call_tool(self, name, arguments):
+        return {"tool": name, "arguments": arguments}
+
+
+@pytest.fixture
+def transports(monkeypatch):
+    """Replace transport creation and ClientSession; yields every transport created."""
+    created: list[FakeTransport] = []
+
+    def create_transport(*args):
+        transport = FakeTransport()
+        created.append(transport)
+        return transport
+
+    monkeypatch.setattr(client, "create_transport", create_transport)
+    monkeypatch.setattr(client, "ClientSession", FakeSession)
+    return created
+
+
+@pytest.mark.asyncio
+async def test_idle_close_keeps_tools_listed(transports, tmp_path):
+    manager = client.MCPClientManager(data_path=str(tmp_path), idle_timeout=0.01)
+    await manager.add_instance(
+        "demo", {"name": "demo", "type": "stdio", "command": "demo"}, save_to_file=False
+    )
+    instance = manager.get_instance("demo")
+    before = manager.get_all_tools()
+
+    await asyncio.sleep(0.02)
+    assert await instance.close_if_idle(manager.idle_timeout)
+    assert not instance.is_connected()
+    assert transports[0].exited
+
+    assert manager.get_all_tools() == before
+    assert list(instance.get_tools()) == ["echo"]
+    assert instance.to_dict()["tools_count"] == 1
+
+    # 下一次调用按需重连
+    result = await instance.call_tool("echo", {"x": 1})
+    assert result == {"tool": "echo", "arguments": {"x": 1}}
+    assert instance.is_connected()
+    assert len(transports) == 2
+
+
+@pytest.mark.asyncio
+async def test_disable_clears_idle_closed_tools(transports, tmp_path):
+    manager = client.MCPClientManager(data_path=str(tmp_path), idle_timeout=0.01)
+    await manager.add_instance(
+        "demo", {"name": "demo", "type": "stdio", "command": "demo"}, save_to_file=False
+    )
+    instance = manager.get_instance("demo")
+
+    await asyncio.sleep(0.02)
+    assert await instance.close_if_idle(manager.idle_timeout)
+    await manager.disable_instance("demo")
+
+    assert not instance.is_idle_closed()
+    assert not instance.get_tools()
+    assert manager.get_all_tools() == {}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_connect_exits_transport(transports, monkeypatch):
+    session_entered = asyncio.Event()
+
+    class HangingSession(FakeSession):
+        async def __aenter__(self):
+            session_entered.set()
+            await asyncio.Event().wait()
+
+    monkeypatch.setattr(client, "ClientSession", HangingSession)
+    instance = client.MCPClientInstance("demo", "demo", "demo", [])
+
+    task = asyncio.create_task(instance.connect())
+    await session_entered.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert transports[0].exited
+    assert not instance.is_connected()
+
+
+async def _idle_closed_instance(manager: client.MCPClientManager) -> client.MCPClientInstance:
+    await manager.add_instance(
+        "demo", {"name": "demo", "type": "stdio", "command": "demo"}, save_to_file=False
+    )
+    instance = manager.get_instance("demo")
+    await asyncio.sleep(0.02)
+    assert await instance.close_if_idle(manager.idle_timeout)
+    return instance
+
+
+@pytest.mark.asyncio
+async def test_enable_and_call_share_one_reconnect(transports, tmp_path):
+    manager = client.MCPClientManager(data_path=str(tmp_path), idle_timeout=0.01)
+    instance = await _idle_closed_instance(manager)
+
+    _, result = await asyncio.gather(
+        manager.enable_instance("demo"), instance.call_tool("echo", {"x": 1})
+    )
+
+    assert result == {"tool": "echo", "arguments": {"x": 1}}
+    assert len(transports) == 2
+    assert not transports[1].exited
+
+
+@pytest.mark.asyncio
+async def test_enable_during_idle_disconnect_keeps_new_session(transports, tmp_path):
+    manager = client.MCPClientManager(data_path=str(tmp_path), idle_timeout=0.01)
+    await manager.add_instance(
+        "demo", {"name": "demo", "type": "stdio", "command": "demo"}, save_to_file=False
+    )
+    instance = manager.get_instance("demo")
+    transports[0].exit_delay = 0.05
+    await asyncio.sleep(0.02)
+
+    closing = asyncio.create_task(instance.close_if_idle(manager.idle_timeout))
+    await asyncio.sleep(0.01)
+    await manager.enable_instance("demo")
+    assert await closing
+
+    assert instance.is_connected()
+    assert transports[0].exited
+    assert not transports[1].exited
+    result = await instance.call_tool("echo", {"x": 1})
+    assert result == {"tool": "echo", "arguments": {"x": 1}}
+
+
+@pytest.mark.asyncio
+async def test_interned_schemas_are_released(transports, tmp_path, monkeypatch):
+    monkeypatch.setattr(client, "_SCHEMA_INTERN", {})
+    interned = []
+    intern_schema = client._intern_schema
+
+    def counting_intern(schema):
+        interned.append(schema)
+        return intern_schema(schema)
+
+    monkeypatch.setattr(client, "_intern_schema", counting_intern)
+    manager = client.MCPClientManager(data_path=str(tmp_path), idle_timeout=0.01)
+    for name in ("one", "two"):
+        await manager.add_instance(
+            name, {"name": name, "type": "stdio", "command": name}, save_to_file=False
+        )
+
+    # 两个实例的相同 schema 共享一个条目
+    assert [entry[1] for entry in client._SCHEMA_INTERN.values()] == [2]
+    one, two = manager.get_instance("one"), manager.get_instance("two")
+    assert one.get_tools()["echo"]["inputSchema"] is two.get_tools()["echo"]["inputSchema"]
+
+    # 空闲重连时 schema 未变，不会重新驻留，引用计数也不变
+    await asyncio.sleep(0.02)
+    assert await one.close_if_idle(manager.idle_timeout)
+    await one.call_tool("echo")
+    assert len(interned) == 2
+    assert [entry[1] for entry in client._SCHEMA_INTERN.values()] == [2]
+
+    await manager.remove_instance("one", delete_file=False)
+    await manager.remove_instance("two", delete_file=False)
+    assert client._SCHEMA_INTERN == {}
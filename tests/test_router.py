@@ -0,0 +1,94 @@
+"""Tests for MCPRouter.batch_call."""
+
+import asyncio
+
+import pytest
+
+from src.core.exceptions import InstanceNotFoundError
+from src.mcp.router import MCPRouter
+
+
+class FakeInstance:
+    """Instance whose tools echo their arguments after an optional delay."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls: list[str] = []
+
+    async def call_tool(self, tool_name, arguments):
+        self.calls.append(tool_name)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(arguments.get("delay", 0))
+            if tool_name == "fail":
+                raise RuntimeError("tool failed")
+            return {"tool": tool_name, "arguments": arguments}
+        finally:
+            self.in_flight -= 1
+
+
+class FakeManager:
+    """Client manager exposing a single 'demo' instance."""
+
+    def __init__(self):
+        self.instance = FakeInstance()
+
+    def get_instance(self, instance_name):
+        if instance_name != "demo":
+            raise InstanceNotFoundError(instance_name)
+        return self.instance
+
+
+@pytest.fixture
+def router():
+    return MCPRouter(FakeManager())
+
+
+def op(tool_name, **arguments):
+    return {"instance_name": "demo", "tool_name": tool_name, "arguments": arguments}
+
+
+@pytest.mark.asyncio
+async def test_results_keep_operation_order(router):
+    results = await router.batch_call([op("slow", delay=0.03), op("fast"), op("mid", delay=0.01)])
+
+    assert [entry["index"] for entry in results] == [0, 1, 2]
+    assert [entry["tool"] for entry in results] == ["slow", "fast", "mid"]
+    assert all(entry["success"] for entry in results)
+    assert results[0]["result"] == {"tool": "slow", "arguments": {"delay": 0.03}}
+
+
+@pytest.mark.asyncio
+async def test_failures_are_reported_per_operation(router):
+    results = await router.batch_call(
+        [op("ok"), op("fail"), "not an object", {"tool_name": "missing_instance"}]
+    )
+
+    assert results[0]["success"]
+    assert results[1]["error"] == "tool failed"
+    assert results[1]["code"] == "INTERNAL_ERROR"
+    assert not results[2]["success"]
+    assert results[2]["tool"] is None
+    assert not results[3]["success"]
+    assert results[3]["tool"] == "missing_instance"
+
+
+@pytest.mark.asyncio
+async def test_stop_on_error_skips_pending_calls(router):
+    results = await router.batch_call(
+        [op("fail"), op("after"), op("later")], max_concurrent=1, stop_on_error=True
+    )
+
+    assert results[0]["error"] == "tool failed"
+    assert [entry["code"] for entry in results[1:]] == ["SKIPPED", "SKIPPED"]
+    assert router.client_manager.instance.calls == ["fail"]
+
+
+@pytest.mark.asyncio
+async def test_max_concurrent_limits_calls_in_flight(router):
+    results = await router.batch_call([op(f"t{i}", delay=0.01) for i in range(6)], max_concurrent=2)
+
+    assert all(entry["success"] for entry in results)
+    assert router.client_manager.instance.max_in_flight == 2
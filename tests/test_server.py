@@ -0,0 +1,47 @@
+"""Tests for MCPServer tool argument handling."""
+
+import pytest
+
+from src.core.exceptions import ValidationError
+from src.mcp.server import MCPServer
+
+
+class FakeRouter:
+    """Router that records batch_call arguments."""
+
+    def __init__(self):
+        self.batch_kwargs = None
+
+    async def batch_call(self, operations, max_concurrent=8, stop_on_error=False):
+        self.batch_kwargs = {
+            "operations": operations,
+            "max_concurrent": max_concurrent,
+            "stop_on_error": stop_on_error,
+        }
+        return []
+
+
+@pytest.fixture
+def server():
+    return MCPServer(FakeRouter())
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("operations", [None, "ops", [{"tool_name": "a"}, "b"]])
+async def test_batch_call_rejects_malformed_operations(server, operations):
+    with pytest.raises(ValidationError):
+        await server._tool_batch_call({"operations": operations})
+
+
+@pytest.mark.asyncio
+async def test_batch_call_rejects_non_integer_max_concurrent(server):
+    with pytest.raises(ValidationError):
+        await server._tool_batch_call({"operations": [], "maxConcurrent": "many"})
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("value", "expected"), [("4", 4), (0, 1), (-3, 1), (2.0, 2)])
+async def test_batch_call_coerces_max_concurrent(server, value, expected):
+    await server._tool_batch_call({"operations": [], "maxConcurrent": value})
+
+    assert server.router.batch_kwargs["max_concurrent"] == expected